@@ -1,4 +1,5 @@
 """The EFAX Library."""
+from ._src.bucketing import BucketedFunction, bucketed
 from ._src.distributions.bernoulli import BernoulliEP, BernoulliNP
 from ._src.distributions.beta import BetaEP, BetaNP
 from ._src.distributions.chi import ChiEP, ChiNP
@@ -10,9 +11,12 @@ from ._src.distributions.cmvn.unit import (ComplexMultivariateUnitNormalEP,
 from ._src.distributions.complex_normal.complex_normal import ComplexNormalEP, ComplexNormalNP
 from ._src.distributions.complex_normal.unit import ComplexUnitNormalEP, ComplexUnitNormalNP
 from ._src.distributions.dirichlet import DirichletEP, DirichletNP
+from ._src.distributions.dirichlet_common import DirichletMinimizer
 from ._src.distributions.exponential import ExponentialEP, ExponentialNP
 from ._src.distributions.gamma import GammaEP, GammaNP, GammaVP
-from ._src.distributions.gen_dirichlet import GeneralizedDirichletEP, GeneralizedDirichletNP
+from ._src.distributions.gen_dirichlet import (GeneralizedDirichletEP,
+                                               GeneralizedDirichletMinimizer,
+                                               GeneralizedDirichletNP)
 from ._src.distributions.geometric import GeometricEP, GeometricNP
 from ._src.distributions.logarithmic import LogarithmicEP, LogarithmicNP
 from ._src.distributions.multinomial import MultinomialEP, MultinomialNP
@@ -25,6 +29,8 @@ from ._src.distributions.multivariate_normal.diagonal import (MultivariateDiagon
 from ._src.distributions.multivariate_normal.fixed_variance import (
     MultivariateFixedVarianceNormalEP, MultivariateFixedVarianceNormalNP)
 from ._src.distributions.multivariate_normal.isotropic import IsotropicNormalEP, IsotropicNormalNP
+from ._src.distributions.multivariate_normal.packed import (MultivariatePackedNormalEP,
+                                                            MultivariatePackedNormalNP)
 from ._src.distributions.multivariate_normal.unit import (MultivariateUnitNormalEP,
                                                           MultivariateUnitNormalNP)
 from ._src.distributions.negative_binomial import NegativeBinomialEP, NegativeBinomialNP
@@ -32,7 +38,8 @@ from ._src.distributions.normal.normal import NormalEP, NormalNP, NormalVP
 from ._src.distributions.normal.unit import UnitNormalEP, UnitNormalNP
 from ._src.distributions.poisson import PoissonEP, PoissonNP
 from ._src.distributions.rayleigh import RayleighEP, RayleighNP
-from ._src.distributions.von_mises import VonMisesFisherEP, VonMisesFisherNP
+from ._src.distributions.von_mises import (VonMisesFisherEP, VonMisesFisherMinimizer,
+                                           VonMisesFisherNP)
 from ._src.distributions.weibull import WeibullEP, WeibullNP
 from ._src.expectation_parametrization import ExpectationParametrization
 from ._src.interfaces.conjugate_prior import HasConjugatePrior, HasGeneralizedConjugatePrior
@@ -40,12 +47,17 @@ from ._src.interfaces.multidimensional import Multidimensional
 from ._src.interfaces.samplable import Samplable
 from ._src.iteration import (flat_dict_of_observations, flat_dict_of_parameters, flatten_mapping,
                              parameters, support, unflatten_mapping)
+from ._src.mixins.exp_to_nat.exp_to_nat import ExpToNatInfo
+from ._src.mixins.exp_to_nat.newton import NewtonMinimizer
 from ._src.mixins.has_entropy import HasEntropy, HasEntropyEP, HasEntropyNP
+from ._src.natural_gradient import natural_gradient
 from ._src.natural_parametrization import NaturalParametrization
 from ._src.parameter import (BooleanRing, ComplexField, IntegralRing, RealField, Ring,
                              ScalarSupport, SquareMatrixSupport, Support, SymmetricMatrixSupport,
-                             VectorSupport)
+                             VectorSupport, pack_symmetric_matrix, unpack_symmetric_matrix)
 from ._src.parametrization import Distribution, SimpleDistribution
+from ._src.precompile import (PrecompiledKernels, enable_compilation_cache, load_precompiled,
+                              precompile)
 from ._src.scipy_replacement.complex_multivariate_normal import ScipyComplexMultivariateNormal
 from ._src.scipy_replacement.complex_normal import ScipyComplexNormal
 from ._src.scipy_replacement.dirichlet import ScipyDirichlet, ScipyGeneralizedDirichlet
@@ -54,7 +66,9 @@ from ._src.scipy_replacement.joint import ScipyJointDistribution
 from ._src.scipy_replacement.multivariate_normal import ScipyMultivariateNormal
 from ._src.scipy_replacement.von_mises import ScipyVonMises, ScipyVonMisesFisher
 from ._src.structure import Flattener, MaximumLikelihoodEstimator, Structure, SubDistributionInfo
-from ._src.tools import parameter_dot_product, parameter_map, parameter_mean
+from ._src.tools import (inverse_digamma, parameter_broadcast_to, parameter_concatenate,
+                         parameter_dot_product, parameter_map, parameter_mean, parameter_reshape,
+                         parameter_set, parameter_stack, parameter_take, parameter_where)
 from ._src.transform.joint import JointDistribution, JointDistributionE, JointDistributionN
 
 __all__ = [
@@ -63,6 +77,7 @@ __all__ = [
     'BetaEP',
     'BetaNP',
     'BooleanRing',
+    'BucketedFunction',
     'ChiEP',
     'ChiNP',
     'ChiSquareEP',
@@ -77,8 +92,10 @@ __all__ = [
     'ComplexUnitNormalEP',
     'ComplexUnitNormalNP',
     'DirichletEP',
+    'DirichletMinimizer',
     'DirichletNP',
     'Distribution',
+    'ExpToNatInfo',
     'ExpectationParametrization',
     'ExponentialEP',
     'ExponentialNP',
@@ -87,6 +104,7 @@ __all__ = [
     'GammaNP',
     'GammaVP',
     'GeneralizedDirichletEP',
+    'GeneralizedDirichletMinimizer',
     'GeneralizedDirichletNP',
     'GeometricEP',
     'GeometricNP',
@@ -115,16 +133,20 @@ __all__ = [
     'MultivariateNormalEP',
     'MultivariateNormalNP',
     'MultivariateNormalVP',
+    'MultivariatePackedNormalEP',
+    'MultivariatePackedNormalNP',
     'MultivariateUnitNormalEP',
     'MultivariateUnitNormalNP',
     'NaturalParametrization',
     'NegativeBinomialEP',
     'NegativeBinomialNP',
+    'NewtonMinimizer',
     'NormalEP',
     'NormalNP',
     'NormalVP',
     'PoissonEP',
     'PoissonNP',
+    'PrecompiledKernels',
     'RayleighEP',
     'RayleighNP',
     'RealField',
@@ -150,16 +172,32 @@ __all__ = [
     'UnitNormalNP',
     'VectorSupport',
     'VonMisesFisherEP',
+    'VonMisesFisherMinimizer',
     'VonMisesFisherNP',
     'WeibullEP',
     'WeibullNP',
+    'bucketed',
+    'enable_compilation_cache',
     'flat_dict_of_observations',
     'flat_dict_of_parameters',
     'flatten_mapping',
+    'inverse_digamma',
+    'load_precompiled',
+    'natural_gradient',
+    'pack_symmetric_matrix',
+    'parameter_broadcast_to',
+    'parameter_concatenate',
     'parameter_dot_product',
     'parameter_map',
     'parameter_mean',
+    'parameter_reshape',
+    'parameter_set',
+    'parameter_stack',
+    'parameter_take',
+    'parameter_where',
     'parameters',
+    'precompile',
     'support',
     'unflatten_mapping',
+    'unpack_symmetric_matrix',
 ]
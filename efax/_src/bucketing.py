@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, Generic, TypeVar
+
+import jax.numpy as jnp
+from jax import jit, stages, tree
+from jax.core import Tracer
+
+from .parametrization import Distribution
+
+R = TypeVar('R')
+
+
+class BucketedFunction(Generic[R]):
+    """A function of distributions whose batches are padded to a bounded set of sizes.
+
+    Jitted functions compile once for every batch shape that they see, so traffic of varying batch
+    sizes recompiles constantly.  This wrapper reshapes the batch to a single axis, pads it up to a
+    bucket size by repeating its first element, calls a compiled executable, and then discards the
+    padding.  The executables are cached by the structure of the arguments (which determines the
+    distribution family), the bucket size, and the dtype and event shape of each leaf (which
+    determine the dimensions).
+
+    When called with traced arguments (e.g., within jit or grad), the function is called directly.
+
+    Args:
+        function: The function to call, e.g., GammaNP.log_normalizer.  Its first argument is a
+            distribution, and every other argument shares the batch shape of that distribution.
+            Each leaf of its output has a leading batch shape.
+        bucket_sizes: The increasing bucket sizes.  Batches larger than the largest bucket are
+            padded to a multiple of it.  By default, the buckets are powers of two.
+        minimum_bucket_size: The smallest bucket when the buckets are powers of two.
+    """
+    def __init__(self,
+                 function: Callable[..., R],
+                 /,
+                 *,
+                 bucket_sizes: Sequence[int] | None = None,
+                 minimum_bucket_size: int = 8) -> None:
+        super().__init__()
+        if bucket_sizes is not None and (not bucket_sizes
+                                         or list(bucket_sizes) != sorted(set(bucket_sizes))
+                                         or bucket_sizes[0] < 1):
+            msg = "Bucket sizes must be positive and increasing"
+            raise ValueError(msg)
+        self.function = function
+        self.bucket_sizes = None if bucket_sizes is None else tuple(bucket_sizes)
+        self.minimum_bucket_size = minimum_bucket_size
+        self._executables: dict[Hashable, stages.Compiled] = {}
+
+    def bucket_size(self, batch_size: int) -> int:
+        """The size to which a batch of the given size is padded."""
+        if self.bucket_sizes is None:
+            return max(self.minimum_bucket_size, 1 << max(batch_size - 1, 0).bit_length())
+        for bucket_size in self.bucket_sizes:
+            if batch_size <= bucket_size:
+                return bucket_size
+        largest = self.bucket_sizes[-1]
+        return largest * math.ceil(batch_size / largest)
+
+    def cache_size(self) -> int:
+        """The number of compiled executables."""
+        return len(self._executables)
+
+    def __call__(self, p: Distribution, /, *args: Any) -> R:
+        if any(isinstance(leaf, Tracer) for leaf in tree.leaves((p, args))):
+            return self.function(p, *args)
+        shape = p.shape
+        batch_size = math.prod(shape)
+        if batch_size == 0:
+            return self.function(p, *args)
+        bucket_size = self.bucket_size(batch_size)
+
+        def pad(x: Any) -> Any:
+            x = jnp.reshape(x, (batch_size, *jnp.shape(x)[len(shape):]))
+            padding = jnp.broadcast_to(x[:1], (bucket_size - batch_size, *x.shape[1:]))
+            return jnp.concatenate([x, padding])
+
+        padded = tree.map(pad, (p, *args))
+        leaves, tree_def = tree.flatten(padded)
+        key = (tree_def, tuple((leaf.dtype, leaf.shape) for leaf in leaves))
+        executable = self._executables.get(key)
+        if executable is None:
+            executable = jit(self.function).lower(*padded).compile()
+            self._executables[key] = executable
+        retval = executable(*padded)
+        return tree.map(lambda y: jnp.reshape(y[:batch_size], (*shape, *y.shape[1:])), retval)
+
+
+def bucketed(function: Callable[..., R],
+             /,
+             *,
+             bucket_sizes: Sequence[int] | None = None,
+             minimum_bucket_size: int = 8) -> BucketedFunction[R]:
+    """Wrap a function of distributions so that it compiles once per bucket of batch sizes.
+
+    See BucketedFunction.
+    """
+    return BucketedFunction(function, bucket_sizes=bucket_sizes,
+                            minimum_bucket_size=minimum_bucket_size)
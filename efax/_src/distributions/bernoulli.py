@@ -50,6 +50,16 @@ class BernoulliNP(HasEntropyNP['BernoulliEP'],
     def to_exp(self) -> BernoulliEP:
         return BernoulliEP(jss.expit(self.log_odds))
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        probability = jss.expit(self.log_odds)
+        return (probability * (1.0 - probability))[..., np.newaxis, np.newaxis]
+
+    @override
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        # The Fisher information is p(1 - p).
+        return -0.5 * (jnp.logaddexp(self.log_odds, 0.0) + jnp.logaddexp(-self.log_odds, 0.0))
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape)
@@ -11,11 +11,11 @@ from typing_extensions import override
 
 from ..expectation_parametrization import ExpectationParametrization
 from ..interfaces.samplable import Samplable
-from ..mixins.exp_to_nat.exp_to_nat import ExpToNat
 from ..mixins.has_entropy import HasEntropyEP, HasEntropyNP
 from ..natural_parametrization import NaturalParametrization
 from ..parameter import RealField, ScalarSupport, distribution_parameter
 from ..parametrization import SimpleDistribution
+from ..tools import inverse_digamma
 
 
 @dataclass
@@ -70,11 +70,9 @@ class ChiSquareNP(HasEntropyNP['ChiSquareEP'],
         return chisquare(key, degrees_of_freedom, shape)
 
 
-# The ExpToNat mixin can be circumvented if the inverse of the digamma function were added to JAX.
 @dataclass
 class ChiSquareEP(HasEntropyEP[ChiSquareNP],
                   Samplable,
-                  ExpToNat[ChiSquareNP],
                   ExpectationParametrization[ChiSquareNP],
                   SimpleDistribution):
     """The expectation parameters of the chi-square distribution with k degrees of freedom.
@@ -101,6 +99,11 @@ class ChiSquareEP(HasEntropyEP[ChiSquareNP],
     def domain_support(cls) -> ScalarSupport:
         return ScalarSupport()
 
+    @override
+    def to_nat(self) -> ChiSquareNP:
+        k_over_two = inverse_digamma(self.mean_log + jnp.log(0.5))
+        return ChiSquareNP(k_over_two - 1.0)
+
     @override
     def expected_carrier_measure(self) -> JaxRealArray:
         q = self.to_nat()
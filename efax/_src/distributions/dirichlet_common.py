@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeAlias, TypeVar
 
 import jax
 import jax.numpy as jnp
+from jax.lax import while_loop
 from jax.scipy import special as jss
-from tjax import JaxRealArray, KeyArray, Shape
-from tjax.dataclasses import dataclass
+from tjax import JaxBooleanArray, JaxIntegralArray, JaxRealArray, KeyArray, Shape
+from tjax.dataclasses import dataclass, field
 from typing_extensions import override
 
 from ..interfaces.multidimensional import Multidimensional
 from ..interfaces.samplable import Samplable
-from ..mixins.exp_to_nat.exp_to_nat import ExpToNat
+from ..mixins.exp_to_nat.exp_to_nat import ExpToNat, ExpToNatInfo, ExpToNatMinimizer
 from ..mixins.has_entropy import HasEntropyEP, HasEntropyNP
 from ..natural_parametrization import NaturalParametrization
 from ..parameter import RealField, VectorSupport, distribution_parameter, negative_support
+from ..tools import inverse_digamma
 
 EP = TypeVar('EP', bound='DirichletCommonEP[Any]')
 
@@ -39,6 +41,20 @@ class DirichletCommonNP(HasEntropyNP[EP],
         return (jnp.sum(jss.gammaln(q + 1.0), axis=-1)
                 - jss.gammaln(jnp.sum(q, axis=-1) + self.dimensions()))
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        # The diagonal-plus-rank-one covariance of the sufficient statistics log(x).
+        alpha = self.alpha_minus_one + 1.0
+        total_trigamma = jss.polygamma(1, jnp.sum(alpha, axis=-1))
+        return (jnp.vectorize(jnp.diag, signature='(n)->(n,n)')(jss.polygamma(1, alpha))
+                - total_trigamma[..., jnp.newaxis, jnp.newaxis])
+
+    @override
+    def flat_fisher_information_diagonal(self) -> JaxRealArray:
+        alpha = self.alpha_minus_one + 1.0
+        total_trigamma = jss.polygamma(1, jnp.sum(alpha, axis=-1, keepdims=True))
+        return jss.polygamma(1, alpha) - total_trigamma
+
     @override
     def sample(self, key: KeyArray, shape: Shape | None = None) -> JaxRealArray:
         if shape is not None:
@@ -65,6 +81,11 @@ class DirichletCommonEP(HasEntropyEP[NP],
     mean_log_probability: JaxRealArray = distribution_parameter(VectorSupport(
         ring=negative_support))
 
+    @override
+    @classmethod
+    def default_minimizer(cls, search_dimensions: int) -> ExpToNatMinimizer:
+        return default_dirichlet_minimizer
+
     @property
     @override
     def shape(self) -> Shape:
@@ -81,3 +102,119 @@ class DirichletCommonEP(HasEntropyEP[NP],
     @override
     def sample(self, key: KeyArray, shape: Shape | None = None) -> JaxRealArray:
         return self.to_nat().sample(key, shape)
+
+
+# The concentration, residual, step count, and convergence.
+_State: TypeAlias = tuple[JaxRealArray, JaxRealArray, JaxIntegralArray, JaxBooleanArray]
+
+
+@dataclass
+class DirichletMinimizer(ExpToNatMinimizer):
+    """Minka's generalized Newton's method for the Dirichlet and beta distributions.
+
+    The Fisher information of the Dirichlet distribution is a diagonal matrix plus a rank-one
+    matrix, so each Newton step is solved in linear time using the Sherman-Morrison formula.  Steps
+    are shortened so that they go at most halfway to the boundary of the support, and then a
+    backtracking line search on the (convex) negative log-likelihood finds the step size.  If the
+    line search fails, Minka's fixed point iteration, which always makes progress, is used instead.
+
+    Args:
+        max_steps: The maximum number of iterations.
+        atol: The absolute tolerance on the residual (the difference in expectation parameters).
+        minimum_step_size: The step size below which the line search fails.
+    """
+    max_steps: int = field(static=True, default=200)
+    atol: float = field(static=True, default=1e-7)
+    minimum_step_size: float = field(static=True, default=1e-10)
+
+    @override
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                        ) -> tuple[JaxRealArray, ExpToNatInfo]:
+        assert isinstance(exp_to_nat, DirichletCommonEP)
+        mean_log_probability = exp_to_nat.mean_log_probability
+        initial_natural_parameters = exp_to_nat.search_to_natural(initial_search_parameters)
+        np_cls = type(initial_natural_parameters)
+
+        def cond_fun(state: _State) -> JaxBooleanArray:
+            _, _, steps, converged = state
+            return (steps < self.max_steps) & ~converged
+
+        def body_fun(state: _State) -> _State:
+            alpha, r, steps, _ = state
+            newton_step = _newton_step(alpha, r)
+            step_size, use_newton = self._line_search(alpha, r, newton_step, mean_log_probability)
+            newton_alpha = alpha - step_size * newton_step
+            fixed_point_alpha = inverse_digamma(jss.digamma(jnp.sum(alpha))
+                                                + mean_log_probability)
+            alpha = jnp.where(use_newton, newton_alpha, fixed_point_alpha)
+            r = _residual(alpha, mean_log_probability)
+            converged = jnp.all(jnp.abs(r) <= self.atol)
+            return alpha, r, steps + 1, converged
+
+        initial_alpha = initial_natural_parameters.alpha_minus_one + 1.0
+        initial_r = _residual(initial_alpha, mean_log_probability)
+        initial_state = (initial_alpha, initial_r, jnp.asarray(0),
+                         jnp.all(jnp.abs(initial_r) <= self.atol))
+        alpha, r, steps, converged = while_loop(cond_fun, body_fun, initial_state)
+        search_parameters = exp_to_nat.natural_to_search(np_cls(alpha - 1.0))
+        return search_parameters, ExpToNatInfo(converged=converged, num_steps=steps,
+                                               residual_norm=jnp.linalg.norm(r))
+
+    def _line_search(self,
+                     alpha: JaxRealArray,
+                     r: JaxRealArray,
+                     newton_step: JaxRealArray,
+                     mean_log_probability: JaxRealArray
+                     ) -> tuple[JaxRealArray, JaxBooleanArray]:
+        """Find the Newton step size, and whether it succeeded.
+
+        The step is shortened so that it goes at most halfway to the boundary of the support, and
+        then it backtracks until the objective decreases sufficiently.  Near the solution, where
+        rounding hides the decrease in the objective, a decrease in the residual suffices.
+        """
+        objective_value = _objective(alpha, mean_log_probability)
+        slope = -jnp.dot(r, newton_step)
+        residual_norm = _finite_norm(r)
+
+        def sufficient_decrease(step_size: JaxRealArray) -> JaxBooleanArray:
+            candidate = alpha - step_size * newton_step
+            return ((_objective(candidate, mean_log_probability)
+                     <= objective_value + 1e-4 * step_size * slope)
+                    | (_finite_norm(_residual(candidate, mean_log_probability)) < residual_norm))
+
+        def backtrack_cond_fun(step_size: JaxRealArray) -> JaxBooleanArray:
+            return (step_size > self.minimum_step_size) & ~sufficient_decrease(step_size)
+
+        step_size = jnp.minimum(1.0, 0.5 * jnp.min(jnp.where(newton_step > 0.0,
+                                                              alpha / newton_step,
+                                                              jnp.inf)))
+        step_size = while_loop(backtrack_cond_fun, lambda step_size: 0.5 * step_size, step_size)
+        return step_size, sufficient_decrease(step_size)
+
+
+def _objective(alpha: JaxRealArray, mean_log_probability: JaxRealArray) -> JaxRealArray:
+    # The negative log-likelihood per observation up to a constant, which is convex.
+    log_normalizer = jnp.sum(jss.gammaln(alpha)) - jss.gammaln(jnp.sum(alpha))
+    return log_normalizer - jnp.dot(alpha, mean_log_probability)
+
+
+def _residual(alpha: JaxRealArray, mean_log_probability: JaxRealArray) -> JaxRealArray:
+    # The gradient of the objective.
+    return jss.digamma(alpha) - jss.digamma(jnp.sum(alpha)) - mean_log_probability
+
+
+def _finite_norm(residual: JaxRealArray) -> JaxRealArray:
+    norm: JaxRealArray = jnp.linalg.norm(residual)
+    return jnp.where(jnp.all(jnp.isfinite(residual)), norm, jnp.inf)
+
+
+def _newton_step(alpha: JaxRealArray, r: JaxRealArray) -> JaxRealArray:
+    # The Fisher information is diag(d) - z 11^T, so the Newton step is found with the
+    # Sherman-Morrison formula.
+    d = jss.polygamma(1, alpha)
+    z = jss.polygamma(1, jnp.sum(alpha))
+    r_over_d = r / d
+    return r_over_d + z * jnp.sum(r_over_d) / (1.0 - z * jnp.sum(1.0 / d)) / d
+
+
+default_dirichlet_minimizer = DirichletMinimizer()
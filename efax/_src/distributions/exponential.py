@@ -46,6 +46,14 @@ class ExponentialNP(HasEntropyNP['ExponentialEP'],
     def to_exp(self) -> ExponentialEP:
         return ExponentialEP(-1.0 / self.negative_rate)
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        return jnp.square(1.0 / self.negative_rate)[..., jnp.newaxis, jnp.newaxis]
+
+    @override
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        return -jnp.log(-self.negative_rate)
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape)
@@ -56,6 +56,23 @@ class GammaNP(HasEntropyNP['GammaEP'],
         return GammaEP(-shape / self.negative_rate,
                        jss.digamma(shape) - jnp.log(-self.negative_rate))
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        # The covariance of the sufficient statistics (x, log(x)).
+        shape = self.shape_minus_one + 1.0
+        rate = -self.negative_rate
+        cross = 1.0 / rate
+        return jnp.stack([jnp.stack([shape / jnp.square(rate), cross], axis=-1),
+                          jnp.stack([cross, jss.polygamma(1, shape)], axis=-1)],
+                         axis=-2)
+
+    @override
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        # The determinant of the Fisher information is (k psi'(k) - 1) / rate^2.
+        shape = self.shape_minus_one + 1.0
+        return (0.5 * jnp.log(shape * jss.polygamma(1, shape) - 1.0)
+                - jnp.log(-self.negative_rate))
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape)
@@ -124,6 +141,11 @@ class GammaEP(HasEntropyEP[GammaNP],
         rate = shape / self.mean
         return GammaNP(-rate, shape - 1.0)
 
+    @override
+    def natural_to_search(self, natural_parameters: GammaNP) -> JaxRealArray:
+        shape = natural_parameters.shape_minus_one + 1.0
+        return inverse_softplus(shape)[..., jnp.newaxis]
+
     @override
     def search_gradient(self, search_parameters: JaxRealArray) -> JaxRealArray:
         shape = softplus(search_parameters[..., 0])
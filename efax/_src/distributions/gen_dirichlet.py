@@ -12,16 +12,18 @@ from typing import Any
 import jax.numpy as jnp
 from jax.nn import softplus
 from jax.scipy.special import betaln, digamma
-from tjax import JaxRealArray, Shape
-from tjax.dataclasses import dataclass
+from tjax import JaxRealArray, Shape, inverse_softplus
+from tjax.dataclasses import dataclass, field
 from typing_extensions import override
 
 from ..expectation_parametrization import ExpectationParametrization
 from ..interfaces.multidimensional import Multidimensional
-from ..mixins.exp_to_nat.exp_to_nat import ExpToNat
+from ..mixins.exp_to_nat.exp_to_nat import ExpToNat, ExpToNatInfo, ExpToNatMinimizer
 from ..mixins.has_entropy import HasEntropyEP, HasEntropyNP
 from ..natural_parametrization import NaturalParametrization
 from ..parameter import RealField, VectorSupport, distribution_parameter, negative_support
+from .beta import BetaEP, BetaNP
+from .dirichlet_common import DirichletMinimizer
 
 
 @dataclass
@@ -117,6 +119,11 @@ class GeneralizedDirichletEP(HasEntropyEP[GeneralizedDirichletNP],
     def natural_parametrization_cls(cls) -> type[GeneralizedDirichletNP]:
         return GeneralizedDirichletNP
 
+    @override
+    @classmethod
+    def default_minimizer(cls, search_dimensions: int) -> ExpToNatMinimizer:
+        return default_generalized_dirichlet_minimizer
+
     @override
     def search_to_natural(self, search_parameters: JaxRealArray) -> GeneralizedDirichletNP:
         # Run Newton's method on the whole real hyperspace.
@@ -125,6 +132,15 @@ class GeneralizedDirichletEP(HasEntropyEP[GeneralizedDirichletNP],
         return GeneralizedDirichletNP(positive_search_parameters[..., :n] - 1.0,
                                       positive_search_parameters[..., n:])
 
+    @override
+    def natural_to_search(self, natural_parameters: GeneralizedDirichletNP) -> JaxRealArray:
+        positive_search_parameters = jnp.concatenate([natural_parameters.alpha_minus_one + 1.0,
+                                                      natural_parameters.gamma],
+                                                     axis=-1)
+        # Gamma can be zero, which is unreachable in search space.
+        eps = jnp.finfo(positive_search_parameters.dtype).eps
+        return inverse_softplus(jnp.maximum(positive_search_parameters, eps))
+
     @override
     def expected_carrier_measure(self) -> JaxRealArray:
         return jnp.zeros(self.shape)
@@ -132,3 +148,59 @@ class GeneralizedDirichletEP(HasEntropyEP[GeneralizedDirichletNP],
     @override
     def dimensions(self) -> int:
         return self.mean_log_probability.shape[-1]
+
+
+@dataclass
+class GeneralizedDirichletMinimizer(ExpToNatMinimizer):
+    """A minimizer that decouples the generalized Dirichlet distribution into beta distributions.
+
+    The log-normalizer is a sum of independent beta log-normalizers in (alpha_i, beta_i), and the
+    expectation parameters are cumulative sums of the beta expectation parameters.  After undoing
+    the cumulative sums, the n beta problems are solved in lockstep, and gamma is recovered from
+    beta_i = alpha_{i+1} + beta_{i+1} + gamma_i.
+
+    Args:
+        max_steps: The maximum number of iterations of the beta minimizer.
+        atol: The absolute tolerance of the beta minimizer.
+    """
+    max_steps: int = field(static=True, default=200)
+    atol: float = field(static=True, default=1e-7)
+
+    @override
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                        ) -> tuple[JaxRealArray, ExpToNatInfo]:
+        assert isinstance(exp_to_nat, GeneralizedDirichletEP)
+        beta_ep = _beta_expectation_parameters(exp_to_nat)
+        alpha, beta = exp_to_nat.search_to_natural(initial_search_parameters).alpha_beta()
+        initial_beta_np = BetaNP(jnp.stack([alpha, beta], axis=-1) - 1.0)
+        beta_minimizer = DirichletMinimizer(max_steps=self.max_steps, atol=self.atol)
+        beta_search_parameters, beta_info = beta_minimizer.solve_batch(
+                beta_ep, beta_ep.natural_to_search(initial_beta_np))
+        alpha_beta = beta_ep.search_to_natural(beta_search_parameters).alpha_minus_one + 1.0
+        search_parameters = exp_to_nat.natural_to_search(_from_alpha_beta(alpha_beta))
+        residual = exp_to_nat.search_gradient(search_parameters)
+        return search_parameters, ExpToNatInfo(converged=jnp.all(beta_info.converged),
+                                               num_steps=jnp.max(beta_info.num_steps),
+                                               residual_norm=jnp.linalg.norm(residual))
+
+
+def _beta_expectation_parameters(exp_to_nat: GeneralizedDirichletEP) -> BetaEP:
+    # Undo the cumulative sums in GeneralizedDirichletNP.to_exp.
+    gamma_bar = exp_to_nat.mean_log_cumulative_probability
+    shifted_gamma_bar = jnp.concatenate([jnp.zeros(1), gamma_bar[:-1]])
+    beta_bar = gamma_bar - shifted_gamma_bar
+    alpha_bar_direct = exp_to_nat.mean_log_probability - shifted_gamma_bar
+    return BetaEP(jnp.stack([alpha_bar_direct, beta_bar], axis=-1))
+
+
+def _from_alpha_beta(alpha_beta: JaxRealArray) -> GeneralizedDirichletNP:
+    alpha = alpha_beta[:, 0]
+    beta = alpha_beta[:, 1]
+    # beta_i = alpha_{i+1} + beta_{i+1} + gamma_i, where the final alpha and beta are zero and one.
+    next_alpha = jnp.concatenate([alpha[1:], jnp.zeros(1)])
+    next_beta = jnp.concatenate([beta[1:], jnp.ones(1)])
+    gamma = beta - next_alpha - next_beta
+    return GeneralizedDirichletNP(alpha - 1.0, gamma)
+
+
+default_generalized_dirichlet_minimizer = GeneralizedDirichletMinimizer()
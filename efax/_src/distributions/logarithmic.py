@@ -8,7 +8,7 @@ from tjax.dataclasses import dataclass
 from typing_extensions import override
 
 from ..expectation_parametrization import ExpectationParametrization
-from ..mixins.exp_to_nat.exp_to_nat import ExpToNat
+from ..mixins.exp_to_nat.exp_to_nat import ExpToNat, ExpToNatInfo
 from ..natural_parametrization import NaturalParametrization
 from ..parameter import (IntegralRing, RealField, ScalarSupport, distribution_parameter,
                          negative_support)
@@ -91,10 +91,11 @@ class LogarithmicEP(ExpToNat[LogarithmicNP],
     # The expected_carrier_measure is unknown.
 
     @override
-    def to_nat(self) -> LogarithmicNP:
-        z: LogarithmicNP = super().to_nat()
+    def to_nat_with_info(self, initial: LogarithmicNP | None = None
+                         ) -> tuple[LogarithmicNP, ExpToNatInfo]:
+        z, info = super().to_nat_with_info(initial)
         return LogarithmicNP(jnp.where(self.chi < 1.0,
                                        jnp.nan,
                                        jnp.where(self.chi == 1.0,
                                                  jnp.inf,
-                                                 z.log_probability)))
+                                                 z.log_probability))), info
@@ -7,7 +7,7 @@ import jax.numpy as jnp
 import numpy as np
 from jax.nn import one_hot
 from jax.scipy import special as jss
-from tjax import JaxRealArray, KeyArray, Shape
+from tjax import JaxRealArray, KeyArray, Shape, outer_product
 from tjax.dataclasses import dataclass
 from typing_extensions import override
 
@@ -57,6 +57,18 @@ class MultinomialNP(HasEntropyNP['MultinomialEP'],
         log_scaled_a = jnp.logaddexp(-max_q, jss.logsumexp(q_minus_max_q, axis=-1))
         return MultinomialEP(jnp.exp(q_minus_max_q - log_scaled_a[..., np.newaxis]))
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        # The covariance of the one-hot sufficient statistics excluding the last category.
+        probability = self.to_exp().probability
+        return (jnp.vectorize(jnp.diag, signature='(n)->(n,n)')(probability)
+                - outer_product(probability, probability))
+
+    @override
+    def flat_fisher_information_diagonal(self) -> JaxRealArray:
+        probability = self.to_exp().probability
+        return probability * (1.0 - probability)
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape[:-1])
@@ -75,6 +75,34 @@ class MultivariateNormalNP(HasEntropyNP['MultivariateNormalEP'],
         second_moment = 0.25 * outer_product(h_inv_times_eta, h_inv_times_eta) - 0.5 * h_inv
         return MultivariateNormalEP(mean, second_moment)
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        # The covariance of the sufficient statistics x and x x^T.  The flattened precision holds
+        # the upper triangle, so each off-diagonal statistic x_i x_j counts twice.  With the
+        # second moment E, the covariances are
+        #   Cov(x_k, x_i x_j) = mu_i Sigma_kj + mu_j Sigma_ki, and
+        #   Cov(x_i x_j, x_k x_l) = E_ik E_jl + E_il E_jk - 2 mu_i mu_j mu_k mu_l.
+        variance = self.variance()
+        mean = matrix_vector_mul(variance, self.mean_times_precision)
+        second_moment = variance + outer_product(mean, mean)
+        rows, columns = np.triu_indices(self.dimensions())
+        weights = np.where(rows == columns, 1.0, 2.0)
+        mean_r = mean[..., rows]
+        mean_c = mean[..., columns]
+        linear = variance
+        cross = (mean_r[..., np.newaxis, :] * variance[..., :, columns]
+                 + mean_c[..., np.newaxis, :] * variance[..., :, rows]) * weights
+        mean_rc = mean_r * mean_c
+        quadratic = (second_moment[..., rows[:, np.newaxis], rows]
+                     * second_moment[..., columns[:, np.newaxis], columns]
+                     + second_moment[..., rows[:, np.newaxis], columns]
+                     * second_moment[..., columns[:, np.newaxis], rows]
+                     - 2.0 * mean_rc[..., :, np.newaxis] * mean_rc[..., np.newaxis, :])
+        quadratic *= weights[:, np.newaxis] * weights
+        return jnp.concatenate([jnp.concatenate([linear, cross], axis=-1),
+                                jnp.concatenate([jnp.matrix_transpose(cross), quadratic], axis=-1)],
+                               axis=-2)
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape[:-1])
@@ -55,6 +55,15 @@ class MultivariateDiagonalNormalNP(HasEntropyNP['MultivariateDiagonalNormalEP'],
         second_moment = jnp.square(mean) - 0.5 / self.negative_half_precision
         return MultivariateDiagonalNormalEP(mean, second_moment)
 
+    @override
+    def flat_fisher_information_diagonal(self) -> JaxRealArray:
+        # The variances of the sufficient statistics x and x^2.
+        mean = -self.mean_times_precision / (2.0 * self.negative_half_precision)
+        variance = -0.5 / self.negative_half_precision
+        return jnp.concatenate([variance,
+                                2.0 * jnp.square(variance) + 4.0 * jnp.square(mean) * variance],
+                               axis=-1)
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape[:-1])
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Any
+
+import jax.numpy as jnp
+from tjax import JaxRealArray, KeyArray, Shape, outer_product
+from tjax.dataclasses import dataclass
+from typing_extensions import override
+
+from ...expectation_parametrization import ExpectationParametrization
+from ...interfaces.multidimensional import Multidimensional
+from ...interfaces.samplable import Samplable
+from ...mixins.has_entropy import HasEntropyEP, HasEntropyNP
+from ...natural_parametrization import NaturalParametrization
+from ...parameter import (SymmetricMatrixSupport, VectorSupport, distribution_parameter,
+                          pack_symmetric_matrix, unpack_symmetric_matrix)
+from .arbitrary import MultivariateNormalEP, MultivariateNormalNP, MultivariateNormalVP
+
+
+@dataclass
+class MultivariatePackedNormalNP(HasEntropyNP['MultivariatePackedNormalEP'],
+                                 NaturalParametrization['MultivariatePackedNormalEP',
+                                                        JaxRealArray],
+                                 Multidimensional,
+                                 Samplable):
+    """The natural parametrization of the multivariate normal distribution in packed storage.
+
+    This is the same family as MultivariateNormalNP, but the precision is held as its packed upper
+    triangle (see pack_symmetric_matrix), which nearly halves the memory of the parameters.
+
+    Args:
+        mean_times_precision: E(x) / Var(x).
+        negative_half_precision: The packed upper triangle of -0.5 / Var(x).
+    """
+    mean_times_precision: JaxRealArray = distribution_parameter(VectorSupport())
+    negative_half_precision: JaxRealArray = distribution_parameter(SymmetricMatrixSupport(
+        negative_semidefinite=True, packed=True))
+
+    @property
+    @override
+    def shape(self) -> Shape:
+        return self.mean_times_precision.shape[:-1]
+
+    @override
+    @classmethod
+    def domain_support(cls) -> VectorSupport:
+        return VectorSupport()
+
+    @override
+    def log_normalizer(self) -> JaxRealArray:
+        return self.unpacked().log_normalizer()
+
+    @override
+    def sample(self, key: KeyArray, shape: Shape | None = None) -> JaxRealArray:
+        return self.to_variance_parametrization().sample(key, shape)
+
+    def unpacked(self) -> MultivariateNormalNP:
+        """Returns: The same distribution with the precision held as a full matrix."""
+        return MultivariateNormalNP(self.mean_times_precision,
+                                    unpack_symmetric_matrix(self.negative_half_precision))
+
+    def to_variance_parametrization(self) -> MultivariateNormalVP:
+        return self.unpacked().to_variance_parametrization()
+
+    @override
+    def to_exp(self) -> MultivariatePackedNormalEP:
+        return MultivariatePackedNormalEP.from_unpacked(self.unpacked().to_exp())
+
+    @override
+    def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
+        return jnp.zeros(x.shape[:-1])
+
+    @override
+    @classmethod
+    def sufficient_statistics(cls, x: JaxRealArray, **fixed_parameters: Any
+                              ) -> MultivariatePackedNormalEP:
+        return MultivariatePackedNormalEP(x, pack_symmetric_matrix(outer_product(x, x)))
+
+    @override
+    def dimensions(self) -> int:
+        return self.mean_times_precision.shape[-1]
+
+
+@dataclass
+class MultivariatePackedNormalEP(HasEntropyEP[MultivariatePackedNormalNP],
+                                 ExpectationParametrization[MultivariatePackedNormalNP],
+                                 Multidimensional,
+                                 Samplable):
+    """The expectation parametrization of the multivariate normal distribution in packed storage.
+
+    Args:
+        mean: E(x).
+        second_moment: The packed upper triangle of E(x x^T).
+    """
+    mean: JaxRealArray = distribution_parameter(VectorSupport())
+    second_moment: JaxRealArray = distribution_parameter(SymmetricMatrixSupport(
+        positive_semidefinite=True, packed=True))
+
+    @property
+    @override
+    def shape(self) -> Shape:
+        return self.mean.shape[:-1]
+
+    @override
+    @classmethod
+    def domain_support(cls) -> VectorSupport:
+        return VectorSupport()
+
+    @classmethod
+    @override
+    def natural_parametrization_cls(cls) -> type[MultivariatePackedNormalNP]:
+        return MultivariatePackedNormalNP
+
+    @classmethod
+    def from_unpacked(cls, p: MultivariateNormalEP) -> MultivariatePackedNormalEP:
+        return cls(p.mean, pack_symmetric_matrix(p.second_moment))
+
+    def unpacked(self) -> MultivariateNormalEP:
+        """Returns: The same distribution with the second moment held as a full matrix."""
+        return MultivariateNormalEP(self.mean, unpack_symmetric_matrix(self.second_moment))
+
+    @override
+    def to_nat(self) -> MultivariatePackedNormalNP:
+        q = self.unpacked().to_nat()
+        # Symmetrize the inverse, which is not exactly symmetric, so that packing it does not
+        # discard the rounding error of its lower triangle.
+        h = q.negative_half_precision
+        h = 0.5 * (h + jnp.matrix_transpose(h))
+        return MultivariatePackedNormalNP(q.mean_times_precision, pack_symmetric_matrix(h))
+
+    @override
+    def expected_carrier_measure(self) -> JaxRealArray:
+        return jnp.zeros(self.shape)
+
+    @override
+    def sample(self, key: KeyArray, shape: Shape | None = None) -> JaxRealArray:
+        return self.to_variance_parametrization().sample(key, shape)
+
+    @override
+    def dimensions(self) -> int:
+        return self.mean.shape[-1]
+
+    def variance(self) -> JaxRealArray:
+        return self.unpacked().variance()
+
+    def to_variance_parametrization(self) -> MultivariateNormalVP:
+        return self.unpacked().to_variance_parametrization()
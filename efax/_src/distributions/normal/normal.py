@@ -53,6 +53,23 @@ class NormalNP(HasEntropyNP['NormalEP'],
         second_moment = jnp.square(mean) - 0.5 / self.negative_half_precision
         return NormalEP(mean, second_moment)
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        # The covariance of the sufficient statistics (x, x^2).
+        mean = -self.mean_times_precision / (2.0 * self.negative_half_precision)
+        variance = -0.5 / self.negative_half_precision
+        cross = 2.0 * mean * variance
+        quadratic = 2.0 * jnp.square(variance) + 4.0 * jnp.square(mean) * variance
+        return jnp.stack([jnp.stack([variance, cross], axis=-1),
+                          jnp.stack([cross, quadratic], axis=-1)],
+                         axis=-2)
+
+    @override
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        # The determinant of the Fisher information is 2 variance^3.
+        log_variance = -jnp.log(-2.0 * self.negative_half_precision)
+        return 0.5 * (np.log(2.0) + 3.0 * log_variance)
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return jnp.zeros(x.shape)
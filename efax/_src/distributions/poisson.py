@@ -47,6 +47,14 @@ class PoissonNP(Samplable,
     def to_exp(self) -> PoissonEP:
         return PoissonEP(jnp.exp(self.log_mean))
 
+    @override
+    def fisher_information_matrix(self) -> JaxRealArray:
+        return jnp.exp(self.log_mean)[..., jnp.newaxis, jnp.newaxis]
+
+    @override
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        return 0.5 * self.log_mean
+
     @override
     def carrier_measure(self, x: JaxRealArray) -> JaxRealArray:
         return -jss.gammaln(x + 1)
@@ -6,12 +6,12 @@ from typing import Any
 import jax.numpy as jnp
 from jax.nn import softplus
 from tjax import JaxRealArray, Shape, inverse_softplus
-from tjax.dataclasses import dataclass
+from tjax.dataclasses import dataclass, field
 from typing_extensions import override
 
 from ..expectation_parametrization import ExpectationParametrization
 from ..interfaces.multidimensional import Multidimensional
-from ..mixins.exp_to_nat.exp_to_nat import ExpToNat
+from ..mixins.exp_to_nat.exp_to_nat import ExpToNat, ExpToNatInfo, ExpToNatMinimizer
 from ..mixins.has_entropy import HasEntropyEP, HasEntropyNP
 from ..natural_parametrization import NaturalParametrization
 from ..parameter import CircularBoundedSupport, VectorSupport, distribution_parameter
@@ -116,8 +116,14 @@ class VonMisesFisherEP(HasEntropyEP[VonMisesFisherNP],
     def expected_carrier_measure(self) -> JaxRealArray:
         return jnp.zeros(self.shape)
 
+    @override
+    @classmethod
+    def default_minimizer(cls, search_dimensions: int) -> ExpToNatMinimizer:
+        return default_von_mises_fisher_minimizer
+
     @override
     def initial_search_parameters(self) -> JaxRealArray:
+        # This is Banerjee et al.'s approximation.
         mu: JaxRealArray = jnp.linalg.norm(self.mean, 2, axis=-1)
         # 0 <= mu <= 1.0
         initial_kappa = jnp.where(mu == 1.0,
@@ -132,6 +138,10 @@ class VonMisesFisherEP(HasEntropyEP[VonMisesFisherNP],
         q = self.mean * (kappa / mu)
         return VonMisesFisherNP(q)
 
+    @override
+    def natural_to_search(self, natural_parameters: VonMisesFisherNP) -> JaxRealArray:
+        return inverse_softplus(natural_parameters.kappa())[..., jnp.newaxis]
+
     @override
     def search_gradient(self, search_parameters: JaxRealArray) -> JaxRealArray:
         kappa = softplus(search_parameters)
@@ -143,6 +153,57 @@ class VonMisesFisherEP(HasEntropyEP[VonMisesFisherNP],
         return self.mean.shape[-1]
 
 
+@dataclass
+class VonMisesFisherMinimizer(ExpToNatMinimizer):
+    """A bounded number of Newton steps that invert the ratio of Bessel functions.
+
+    Starting from Banerjee et al.'s approximation (see VonMisesFisherEP.initial_search_parameters),
+    a few Newton steps on kappa reach working precision.  They use the analytic derivative
+    A'(kappa) = 1 - A(kappa)^2 - (p - 1) A(kappa) / kappa of the ratio of Bessel functions
+    A(kappa) = I_{p/2}(kappa) / I_{p/2-1}(kappa), so each step costs a single Bessel ratio.
+
+    Args:
+        newton_steps: The number of Newton steps.
+        atol: The absolute tolerance on the residual used to report convergence.
+    """
+    newton_steps: int = field(static=True, default=3)
+    atol: float = field(static=True, default=1e-7)
+
+    @override
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                        ) -> tuple[JaxRealArray, ExpToNatInfo]:
+        assert isinstance(exp_to_nat, VonMisesFisherEP)
+        p = exp_to_nat.dimensions()
+        mu: JaxRealArray = jnp.linalg.norm(exp_to_nat.mean, 2, axis=-1)
+        kappa: JaxRealArray = softplus(initial_search_parameters)[..., 0]
+        # Kappa is zero when mu is zero, and infinite when mu is one.
+        interior = (kappa > 0.0) & jnp.isfinite(kappa)
+        safe_kappa = jnp.where(interior, kappa, 1.0)
+        # Once a step is this small relative to kappa, the quadratic convergence of Newton's method
+        # means that kappa is at working precision.
+        step_tolerance = jnp.sqrt(jnp.finfo(safe_kappa.dtype).eps)
+        num_steps = jnp.zeros(mu.shape, dtype=jnp.int32)
+        for _ in range(self.newton_steps):
+            a = _a_k(p, safe_kappa)
+            a_prime = 1.0 - jnp.square(a) - (p - 1.0) * a / safe_kappa
+            step = (a - mu) / a_prime
+            # Skip negligible steps so that warm starts at the solution take no steps.
+            active = interior & (jnp.abs(step) > step_tolerance * safe_kappa)
+            # Stay positive if the step overshoots.
+            new_kappa = jnp.maximum(safe_kappa - step, 0.5 * safe_kappa)
+            safe_kappa = jnp.where(active, new_kappa, safe_kappa)
+            num_steps += active
+        kappa = jnp.where(interior, safe_kappa, kappa)
+        residual = jnp.where(interior, _a_k(p, safe_kappa) - mu, 0.0)
+        info = ExpToNatInfo(converged=jnp.abs(residual) <= self.atol,
+                            num_steps=num_steps,
+                            residual_norm=jnp.abs(residual))
+        return jnp.asarray(inverse_softplus(kappa))[jnp.newaxis], info
+
+
+default_von_mises_fisher_minimizer = VonMisesFisherMinimizer()
+
+
 # Private functions --------------------------------------------------------------------------------
 def _a_k(k: float | JaxRealArray, kappa: float | JaxRealArray) -> JaxRealArray:
     return iv_ratio(k * 0.5, kappa)
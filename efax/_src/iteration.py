@@ -122,20 +122,13 @@ def parameters(p: Distribution,
     def _parameters(q: Distribution,
                     base_path: Path
                     ) -> Iterable[tuple[Any, ...]]:
-        for this_field in fields(q):
-            name = this_field.name
-            value = getattr(q, name)
-            metadata = this_field.metadata
-            if not metadata.get('parameter', False):
-                continue
-            is_fixed = metadata['fixed']
-            if not isinstance(is_fixed, bool):
-                raise TypeError
+        for name, this_support, is_fixed in _parameter_fields(type(q)):
             if fixed is not None and is_fixed != fixed:
                 continue
+            value = getattr(q, name)
             this_path = (*base_path, name) if recurse else name
             if support:
-                yield this_path, value, metadata['support']
+                yield this_path, value, this_support
             else:
                 yield this_path, value
         if not recurse:
@@ -162,25 +155,10 @@ def support(p: type[Distribution] | Distribution,
     Returns:
         The path, value, and support of each variable parameter.
     """
-    def _parameters(q: type[Distribution],
-                    base_path: Path
-                    ) -> Iterable[tuple[str, Support]]:
-        for this_field in fields(q):
-            name = this_field.name
-            metadata = this_field.metadata
-            if not metadata.get('parameter', False):
-                continue
-            support = metadata['support']
-            is_fixed = metadata['fixed']
-            if not isinstance(is_fixed, bool):
-                raise TypeError
-            if fixed is not None and is_fixed != fixed:
-                continue
-            if not isinstance(support, Support):
-                raise TypeError
-            yield name, support
     cls_p: type[Distribution] = type(p) if isinstance(p, Distribution) else p
-    return dict(_parameters(cls_p, ()))
+    return {name: this_support
+            for name, this_support, is_fixed in _parameter_fields(cls_p)
+            if fixed is None or is_fixed == fixed}
 
 
 def flat_dict_of_parameters(d: Distribution) -> dict[Path, SimpleDistribution]:
@@ -194,3 +172,36 @@ def flat_dict_of_parameters(d: Distribution) -> dict[Path, SimpleDistribution]:
 def flat_dict_of_observations(x: Mapping[str, Any] | JaxComplexArray
                               ) -> dict[Path, JaxComplexArray]:
     return flatten_mapping(x) if isinstance(x, Mapping) else {(): x}
+
+
+# Private functions --------------------------------------------------------------------------------
+# The cache of _parameter_fields.  A dict is used rather than functools.cache since classes do not
+# type-check as Hashable.
+_parameter_fields_cache: dict[type[Any], tuple[tuple[str, Support, bool], ...]] = {}
+
+
+def _parameter_fields(cls: type[Any]) -> tuple[tuple[str, Support, bool], ...]:
+    """Return the name, support, and whether it's fixed of each parameter of a distribution class.
+
+    The dataclass fields of each class are walked once, and the result is cached.
+    """
+    retval = _parameter_fields_cache.get(cls)
+    if retval is None:
+        retval = _parameter_fields_cache[cls] = _walk_parameter_fields(cls)
+    return retval
+
+
+def _walk_parameter_fields(cls: type[Any]) -> tuple[tuple[str, Support, bool], ...]:
+    fields_: list[tuple[str, Support, bool]] = []
+    for this_field in fields(cls):
+        metadata = this_field.metadata
+        if not metadata.get('parameter', False):
+            continue
+        this_support = metadata['support']
+        is_fixed = metadata['fixed']
+        if not isinstance(is_fixed, bool):
+            raise TypeError
+        if not isinstance(this_support, Support):
+            raise TypeError
+        fields_.append((this_field.name, this_support, is_fixed))
+    return tuple(fields_)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import math
 from dataclasses import KW_ONLY, field
-from typing import Any, Generic, Self, TypeAlias, TypeVar
+from functools import partial
+from typing import Any, Generic, TypeAlias, TypeVar
 
 import jax.numpy as jnp
-from jax import vmap
-from tjax import JaxRealArray, jit
+import numpy as np
+from jax import custom_jvp, jacfwd, jvp, tree, vmap
+from jax.dtypes import float0
+from tjax import JaxBooleanArray, JaxIntegralArray, JaxRealArray, jit
 from tjax.dataclasses import dataclass
 from typing_extensions import override
 
@@ -13,50 +17,133 @@ from ...expectation_parametrization import ExpectationParametrization
 from ...natural_parametrization import NaturalParametrization
 from ...parametrization import SimpleDistribution
 from ...structure import Flattener
+from ...tools import parameter_reshape
 
 NP = TypeVar('NP', bound=NaturalParametrization[Any, Any])
 SP: TypeAlias = JaxRealArray
 
 
+@dataclass
+class ExpToNatInfo:
+    """Per-element diagnostics of the minimizer used by ExpToNat.
+
+    Args:
+        converged: Whether the minimizer converged.
+        num_steps: The number of steps taken by the minimizer.
+        residual_norm: The norm of ExpToNat.search_gradient at the solution.
+    """
+    converged: JaxBooleanArray
+    num_steps: JaxIntegralArray
+    residual_norm: JaxRealArray
+
+
 class ExpToNatMinimizer:
-    def solve(self, exp_to_nat: ExpToNat[Any]) -> SP:
+    def solve(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: SP) -> SP:
+        """Solve for the search parameters.
+
+        Args:
+            exp_to_nat: The expectation parameters to convert.
+            initial_search_parameters: The search parameters at which to start.
+        """
+        search_parameters, _ = self.solve_with_info(exp_to_nat, initial_search_parameters)
+        return search_parameters
+
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: SP
+                        ) -> tuple[SP, ExpToNatInfo]:
+        """Solve for the search parameters, and report diagnostics.
+
+        Args:
+            exp_to_nat: The expectation parameters to convert.
+            initial_search_parameters: The search parameters at which to start.
+        """
         raise NotImplementedError
 
+    def solve_batch(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: SP
+                    ) -> tuple[SP, ExpToNatInfo]:
+        """Solve for the search parameters of a batch of expectation parameters.
+
+        By default, this maps solve_with_info over the batch.  Minimizers can override it to
+        avoid paying for the slowest element of the batch.
+
+        Args:
+            exp_to_nat: The expectation parameters to convert, which have shape (n,).
+            initial_search_parameters: The search parameters at which to start, which have shape
+                (n, k).
+        """
+        return vmap(self.solve_with_info)(exp_to_nat, initial_search_parameters)
+
 
 @dataclass
 class ExpToNat(ExpectationParametrization[NP], SimpleDistribution, Generic[NP]):
     """This mixin implements the conversion from expectation to natural parameters.
 
-    It uses Newton's method with a Jacobian to invert the gradient log-normalizer.
+    By default, it uses a damped Newton's method with a Jacobian to invert the gradient
+    log-normalizer.
     """
     _: KW_ONLY
     minimizer: ExpToNatMinimizer | None = field(default=None, repr=False)
 
-    def __post_init__(self) -> None:
-        if hasattr(super(), '__post_init__'):
-            super().__post_init__()  # type: ignore # pyright: ignore
-        if self.minimizer is None:
-            from .optimistix import default_bisection_minimizer, default_minimizer  # noqa: PLC0415
-            initial_search_parameters = self.initial_search_parameters()
-            object.__setattr__(self,
-                               'minimizer',
-                               default_minimizer
-                               if initial_search_parameters.shape[-1] > 1
-                               else default_bisection_minimizer)
+    @classmethod
+    def default_minimizer(cls, search_dimensions: int) -> ExpToNatMinimizer:
+        """The minimizer used when none is provided.
+
+        The minimizer is chosen lazily by to_nat so that constructing expectation parameters does
+        no work.  Newton's method is used even when there is a single search parameter because,
+        unlike bisection, it benefits from warm starts.
+
+        Args:
+            search_dimensions: The number of search parameters.
+        """
+        from .newton import default_newton_minimizer  # noqa: PLC0415
+        return default_newton_minimizer
 
-    @jit
     @override
-    def to_nat(self) -> NP:
-        flattener, flattened = Flattener[Self].flatten(self)  # type: ignore[arg-type]
+    def to_nat(self, initial: NP | None = None) -> NP:
+        """The corresponding natural parameters.
+
+        The solution is differentiated implicitly: its derivatives are found by solving a linear
+        system in the Fisher information at the solution rather than by differentiating the
+        minimizer.
+
+        Args:
+            initial: Natural parameters that are close to the solution (e.g., the solution from a
+                previous step), which are used to warm-start the minimizer.
+        """
+        natural_parameters, _ = self.to_nat_with_info(initial)
+        return natural_parameters
 
-        def solve(flattener: Flattener[Self], flattened: JaxRealArray) -> JaxRealArray:
-            x = flattener.unflatten(flattened)
-            assert self.minimizer is not None
-            return self.minimizer.solve(x)
+    def to_nat_with_info(self, initial: NP | None = None) -> tuple[NP, ExpToNatInfo]:
+        """The corresponding natural parameters, and the minimizer's diagnostics.
+
+        The batch is reshaped to a single axis before solving, so batches having the same number of
+        elements share one compiled solver regardless of their shape.
+
+        Args:
+            initial: Natural parameters that are close to the solution (e.g., the solution from a
+                previous step), which are used to warm-start the minimizer.
+
+        Returns:
+            The natural parameters.
+            The per-element diagnostics, which have shape self.shape.
+        """
+        batch_size = math.prod(self.shape)
+        exp_to_nat = parameter_reshape(self, (batch_size,))
+        flat_initial = None if initial is None else parameter_reshape(initial, (batch_size,))
+        natural_parameters, info = exp_to_nat._flat_to_nat_with_info(flat_initial)  # noqa: SLF001
+        return (parameter_reshape(natural_parameters, self.shape),
+                tree.map(lambda x: jnp.reshape(x, self.shape), info))
 
-        for _ in range(self.ndim):
-            solve = vmap(solve, in_axes=(None, 0))
-        return self.search_to_natural(solve(flattener, flattened))
+    @jit
+    def _flat_to_nat_with_info(self, initial: NP | None) -> tuple[NP, ExpToNatInfo]:
+        # Solve the whole batch at once so that the minimizer can stop working on elements that
+        # have converged.
+        initial_search_parameters = (self.initial_search_parameters()
+                                     if initial is None
+                                     else self.natural_to_search(initial))
+        minimizer = (self.default_minimizer(initial_search_parameters.shape[-1])
+                     if self.minimizer is None
+                     else self.minimizer)
+        return _solve(minimizer, self, initial_search_parameters)
 
     def initial_search_parameters(self) -> SP:
         """The initial value of the parameters used by the search algorithm.
@@ -79,6 +166,18 @@ class ExpToNat(ExpectationParametrization[NP], SimpleDistribution, Generic[NP]):
         flattener = Flattener.create_flattener(self, np_cls, mapped_to_plane=True)
         return flattener.unflatten(search_parameters)
 
+    def natural_to_search(self, natural_parameters: NP) -> SP:
+        """Convert natural parameters to the search parameters.
+
+        This is the inverse of search_to_natural, and it is used to warm-start the minimizer.
+
+        Args:
+            natural_parameters: The natural parameters.
+        Returns: The corresponding parameters in search space.
+        """
+        _, flattened = Flattener.flatten(natural_parameters, map_to_plane=True)
+        return flattened
+
     def search_gradient(self, search_parameters: SP) -> SP:
         """Convert the search parameters to the natural gradient.
 
@@ -94,3 +193,59 @@ class ExpToNat(ExpectationParametrization[NP], SimpleDistribution, Generic[NP]):
         _, self_flat = Flattener.flatten(self, map_to_plane=False)
         _, search_flat = Flattener.flatten(search_ep, map_to_plane=False)
         return search_flat - self_flat
+
+
+@partial(custom_jvp, nondiff_argnums=(0,))
+def _solve(minimizer: ExpToNatMinimizer,
+           exp_to_nat: ExpToNat[NP],
+           initial_search_parameters: SP
+           ) -> tuple[NP, ExpToNatInfo]:
+    search_parameters, info = minimizer.solve_batch(exp_to_nat, initial_search_parameters)
+    return exp_to_nat.search_to_natural(search_parameters), info
+
+
+@_solve.defjvp
+def _solve_jvp(minimizer: ExpToNatMinimizer,
+               primals: tuple[ExpToNat[NP], SP],
+               tangents: tuple[ExpToNat[NP], SP]
+               ) -> tuple[tuple[NP, ExpToNatInfo], tuple[NP, ExpToNatInfo]]:
+    # The solution does not depend on the initial search parameters.
+    exp_to_nat, initial_search_parameters = primals
+    exp_to_nat_dot, _ = tangents
+    natural_parameters, info = _solve(minimizer, exp_to_nat, initial_search_parameters)
+    natural_parameters_dot = vmap(_implicit_jvp)(exp_to_nat, natural_parameters, exp_to_nat_dot)
+    # The diagnostics are not differentiated.
+    info_dot = tree.map(lambda x: (jnp.zeros_like(x) if jnp.issubdtype(x.dtype, jnp.inexact)
+                                   else np.zeros(x.shape, dtype=float0)),
+                        info)
+    return (natural_parameters, info), (natural_parameters_dot, info_dot)
+
+
+def _implicit_jvp(exp_to_nat: ExpToNat[NP],
+                  natural_parameters: NP,
+                  exp_to_nat_dot: ExpToNat[NP]
+                  ) -> NP:
+    # The solution q satisfies to_exp(q) = p.  By the implicit function theorem,
+    # F q_dot = p_dot, where the Fisher information F is the Jacobian of to_exp.
+    np_cls = type(natural_parameters)
+    _, natural_flat = Flattener.flatten(natural_parameters, map_to_plane=False)
+
+    def unflatten(exp_to_nat: ExpToNat[NP], natural_flat: JaxRealArray) -> NP:
+        # The fixed parameters are shared between the natural and expectation parameters.
+        flattener = Flattener.create_flattener(exp_to_nat, np_cls, mapped_to_plane=False)
+        return flattener.unflatten(natural_flat)
+
+    def residual(exp_to_nat: ExpToNat[NP], natural_flat: JaxRealArray) -> JaxRealArray:
+        _, search_flat = Flattener.flatten(unflatten(exp_to_nat, natural_flat).to_exp(),
+                                           map_to_plane=False)
+        _, self_flat = Flattener.flatten(exp_to_nat, map_to_plane=False)
+        return search_flat - self_flat
+
+    fisher_information = jacfwd(residual, argnums=1)(exp_to_nat, natural_flat)
+    _, residual_dot = jvp(partial(residual, natural_flat=natural_flat),
+                          (exp_to_nat,), (exp_to_nat_dot,))
+    natural_flat_dot = -jnp.linalg.solve(fisher_information, residual_dot)
+    _, natural_parameters_dot = jvp(unflatten,
+                                    (exp_to_nat, natural_flat),
+                                    (exp_to_nat_dot, natural_flat_dot))
+    return natural_parameters_dot
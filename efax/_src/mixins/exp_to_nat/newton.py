@@ -0,0 +1,173 @@
+from operator import itemgetter
+from typing import Any, TypeAlias
+
+import jax.numpy as jnp
+from jax import jacfwd, tree, vmap
+from jax.lax import while_loop
+from tjax import JaxBooleanArray, JaxIntegralArray, JaxRealArray
+from tjax.dataclasses import dataclass, field
+from typing_extensions import override
+
+from .exp_to_nat import ExpToNat, ExpToNatInfo, ExpToNatMinimizer
+
+# The search parameters, residual, Jacobian, damping, step count, convergence, and stagnation.  Each
+# has a leading batch axis.
+_State: TypeAlias = tuple[JaxRealArray, JaxRealArray, JaxRealArray, JaxRealArray,
+                          JaxIntegralArray, JaxBooleanArray, JaxBooleanArray]
+
+
+@dataclass
+class NewtonMinimizer(ExpToNatMinimizer):
+    """A damped Newton's method that inverts the gradient log-normalizer.
+
+    The Jacobian of ExpToNat.search_gradient is the Fisher information (the Hessian of the
+    log-normalizer) composed with the Jacobian of search_to_natural.  Each iteration solves the
+    Levenberg-Marquardt system, which is a Newton step whose damping acts like a trust region.
+    Steps that do not reduce the residual are rejected and the damping grows; accepted steps shrink
+    it.  Near the solution, the damping vanishes and convergence is quadratic.
+
+    Batches are solved in two phases so that a few hard elements do not make the whole batch pay
+    the worst-case number of iterations.  First, the whole batch iterates for batch_steps
+    iterations, and elements freeze as soon as they converge.  Then, the elements that remain are
+    gathered into buffers of tail_size elements, which iterate until they finish.
+
+    Args:
+        max_steps: The maximum number of iterations.
+        atol: The absolute tolerance on the residual (the difference in expectation parameters).
+        initial_damping: The initial damping.
+        damping_decrease: The factor by which the damping is multiplied after an accepted step.
+        damping_increase: The factor by which the damping is multiplied after a rejected step.
+        maximum_damping: The damping beyond which the iteration is considered to have stalled.
+        batch_steps: The number of iterations for which the whole batch iterates.
+        tail_size: The number of unfinished elements that iterate together afterwards.
+    """
+    max_steps: int = field(static=True, default=200)
+    atol: float = field(static=True, default=1e-7)
+    initial_damping: float = field(static=True, default=1e-3)
+    damping_decrease: float = field(static=True, default=0.3)
+    damping_increase: float = field(static=True, default=4.0)
+    maximum_damping: float = field(static=True, default=1e12)
+    batch_steps: int = field(static=True, default=20)
+    tail_size: int = field(static=True, default=64)
+
+    @override
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                        ) -> tuple[JaxRealArray, ExpToNatInfo]:
+        exp_to_nat = tree.map(itemgetter(jnp.newaxis), exp_to_nat)
+        x, info = self.solve_batch(exp_to_nat, initial_search_parameters[jnp.newaxis])
+        return x[0], tree.map(itemgetter(0), info)
+
+    @override
+    def solve_batch(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                    ) -> tuple[JaxRealArray, ExpToNatInfo]:
+        state = self._initial_state(exp_to_nat, initial_search_parameters)
+        state = self._iterate(exp_to_nat, state, min(self.batch_steps, self.max_steps))
+        state = self._iterate_tail(exp_to_nat, state)
+        x, residual, _, _, steps, converged, _ = state
+        return x, ExpToNatInfo(converged=converged, num_steps=steps,
+                               residual_norm=jnp.linalg.norm(residual, axis=-1))
+
+    def _iterate_tail(self, exp_to_nat: ExpToNat[Any], state: _State) -> _State:
+        """Iterate the unfinished elements in buffers of tail_size elements."""
+        batch_size = state[0].shape[0]
+        tail_size = min(self.tail_size, batch_size)
+
+        def cond_fun(carry: tuple[_State, JaxBooleanArray]) -> JaxBooleanArray:
+            state, attempted = carry
+            return jnp.any(self._active(state, self.max_steps) & ~attempted)
+
+        def body_fun(carry: tuple[_State, JaxBooleanArray]) -> tuple[_State, JaxBooleanArray]:
+            state, attempted = carry
+            # Out-of-bounds indices pad the buffer.  Gathering clamps them, and scattering drops
+            # them.
+            indices, = jnp.nonzero(self._active(state, self.max_steps) & ~attempted,
+                                   size=tail_size, fill_value=batch_size)
+            tail_exp_to_nat = tree.map(itemgetter(indices), exp_to_nat)
+            tail_state = tree.map(itemgetter(indices), state)
+            tail_state = self._iterate(tail_exp_to_nat, tail_state, self.max_steps)
+            state = tree.map(lambda x, y: x.at[indices].set(y, mode='drop'), state, tail_state)
+            attempted = attempted.at[indices].set(True, mode='drop')
+            return state, attempted
+
+        state, _ = while_loop(cond_fun, body_fun,
+                              (state, jnp.zeros(batch_size, dtype=jnp.bool_)))
+        return state
+
+    def _residual_and_jacobian(self, exp_to_nat: ExpToNat[Any], x: JaxRealArray
+                               ) -> tuple[JaxRealArray, JaxRealArray]:
+        def g(x: JaxRealArray) -> tuple[JaxRealArray, JaxRealArray]:
+            residual = exp_to_nat.search_gradient(x)
+            return residual, residual
+        jacobian, residual = jacfwd(g, has_aux=True)(x)
+        return residual, jacobian
+
+    def _initial_state(self, exp_to_nat: ExpToNat[Any], initial: JaxRealArray) -> _State:
+        residual, jacobian = vmap(self._residual_and_jacobian)(exp_to_nat, initial)
+        batch_size = initial.shape[0]
+        damping = jnp.full(batch_size, self.initial_damping, dtype=initial.dtype)
+        return (initial, residual, jacobian, damping, jnp.zeros(batch_size, dtype=jnp.int32),
+                jnp.all(jnp.abs(residual) <= self.atol, axis=-1),
+                jnp.zeros(batch_size, dtype=jnp.bool_))
+
+    @staticmethod
+    def _active(state: _State, step_limit: int) -> JaxBooleanArray:
+        _, _, _, _, steps, converged, stalled = state
+        return (steps < step_limit) & ~converged & ~stalled
+
+    def _iterate(self, exp_to_nat: ExpToNat[Any], state: _State, step_limit: int) -> _State:
+        """Iterate until every element has converged, stalled, or reached step_limit steps."""
+        def cond_fun(state: _State) -> JaxBooleanArray:
+            return jnp.any(self._active(state, step_limit))
+
+        def body_fun(state: _State) -> _State:
+            active = self._active(state, step_limit)
+            x, residual, jacobian, damping, _, _, _ = state
+            step = _damped_newton_step(residual, jacobian, damping)
+            candidate = vmap(self._residual_and_jacobian)(exp_to_nat, x + step)
+            return self._update(state, active, step, candidate)
+
+        return while_loop(cond_fun, body_fun, state)
+
+    def _update(self,
+                state: _State,
+                active: JaxBooleanArray,
+                step: JaxRealArray,
+                candidate: tuple[JaxRealArray, JaxRealArray]
+                ) -> _State:
+        """Accept the steps that reduce the residual, and adapt the damping."""
+        x, residual, jacobian, damping, steps, converged, stalled = state
+        candidate_residual, candidate_jacobian = candidate
+        residual_norm = jnp.linalg.norm(residual, axis=-1)
+        candidate_norm = jnp.linalg.norm(candidate_residual, axis=-1)
+        # Frozen elements are not updated.
+        accept = active & jnp.isfinite(candidate_norm) & (candidate_norm < residual_norm)
+        reject = active & ~accept
+        x = jnp.where(accept[:, jnp.newaxis], x + step, x)
+        residual = jnp.where(accept[:, jnp.newaxis], candidate_residual, residual)
+        jacobian = jnp.where(accept[:, jnp.newaxis, jnp.newaxis], candidate_jacobian, jacobian)
+        damping = jnp.where(accept, damping * self.damping_decrease,
+                            jnp.where(reject, damping * self.damping_increase, damping))
+        # Converge when the residual is small, or when an accepted step no longer changes the
+        # search parameters at working precision.
+        x_scale = jnp.finfo(x.dtype).eps * (1.0 + jnp.linalg.norm(x, axis=-1))
+        converged = (converged
+                     | (active & jnp.all(jnp.abs(residual) <= self.atol, axis=-1))
+                     | (accept & (jnp.linalg.norm(step, axis=-1) <= x_scale)))
+        # Stall when no step reduces the residual.
+        stalled |= (active & (damping >= self.maximum_damping))
+        steps += active
+        return x, residual, jacobian, damping, steps, converged, stalled
+
+
+def _damped_newton_step(residual: JaxRealArray, jacobian: JaxRealArray, damping: JaxRealArray
+                        ) -> JaxRealArray:
+    # Solve the damped Newton system.  As the damping goes to zero, this is Newton's method; as it
+    # grows, this is gradient descent on the norm of the residual.
+    identity = jnp.eye(residual.shape[-1], dtype=residual.dtype)
+    jt = jnp.swapaxes(jacobian, -1, -2)
+    damped = jt @ jacobian + damping[:, jnp.newaxis, jnp.newaxis] * identity
+    step: JaxRealArray = -jnp.linalg.solve(damped, jt @ residual[..., jnp.newaxis])[..., 0]
+    return step
+
+
+default_newton_minimizer = NewtonMinimizer()
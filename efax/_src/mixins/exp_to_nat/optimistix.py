@@ -8,7 +8,7 @@ from tjax.dataclasses import dataclass, field
 from tjax.gradient import Adam
 from typing_extensions import override
 
-from .exp_to_nat import ExpToNat, ExpToNatMinimizer
+from .exp_to_nat import ExpToNat, ExpToNatInfo, ExpToNatMinimizer
 
 type RootFinder[Y, Out, Aux] = (
         optx.AbstractRootFinder[Y, Out, Aux, Any]
@@ -23,7 +23,8 @@ class OptimistixRootFinder(ExpToNatMinimizer):
     send_lower_and_upper: bool = field(static=True, default=False)
 
     @override
-    def solve(self, exp_to_nat: ExpToNat[Any]) -> JaxRealArray:
+    def solve_with_info(self, exp_to_nat: ExpToNat[Any], initial_search_parameters: JaxRealArray
+                        ) -> tuple[JaxRealArray, ExpToNatInfo]:
         @jit
         def f(x: JaxRealArray, args: None, /) -> JaxRealArray:
             if self.send_lower_and_upper:
@@ -33,7 +34,7 @@ class OptimistixRootFinder(ExpToNatMinimizer):
                 retval = retval[0]
             return retval
 
-        initial = exp_to_nat.initial_search_parameters()
+        initial = initial_search_parameters
         if self.send_lower_and_upper:
             options = {}
             assert initial.shape == (1,)
@@ -44,9 +45,11 @@ class OptimistixRootFinder(ExpToNatMinimizer):
             options = None
         results: optx.Solution[JaxRealArray, None] = optx.root_find(
                 f, self.solver, initial, max_steps=self.max_steps, throw=False, options=options)
-        if self.send_lower_and_upper:
-            return results.value[jnp.newaxis]
-        return results.value
+        value = results.value[jnp.newaxis] if self.send_lower_and_upper else results.value
+        info = ExpToNatInfo(converged=jnp.asarray(results.result == optx.RESULTS.successful),
+                            num_steps=jnp.asarray(results.stats['num_steps'], dtype=jnp.int32),
+                            residual_norm=jnp.linalg.norm(exp_to_nat.search_gradient(value)))
+        return value, info
 
 
 default_minimizer = OptimistixRootFinder(
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import jax.numpy as jnp
+import lineax as lx
+import optax
+from jax import jvp, tree, vjp
+from jax.dtypes import float0
+
+from .natural_parametrization import NaturalParametrization
+from .structure import Flattener
+
+_no_params_message = ("natural_gradient requires the current value of the parameters, so pass "
+                      "params when calling update.")
+
+
+def natural_gradient(*, solver: lx.AbstractLinearSolver[Any] | None = None
+                     ) -> optax.GradientTransformation:
+    """Precondition the cotangents of natural parametrizations with their Fisher information.
+
+    Every natural parametrization in the parameters has its cotangent multiplied by its inverse
+    Fisher information, which gives the natural gradient.  Since the Fisher information is the
+    Jacobian of to_exp, the natural gradient with respect to the natural parameters is the gradient
+    with respect to the expectation parameters, so a descent step is a mirror descent step.  The
+    closed-form Fisher information is used where it is available, and the Fisher operator is
+    solved otherwise.  Other parameters pass through unchanged.
+
+    This transformation is usually chained before a learning rate, e.g.,
+    optax.chain(natural_gradient(), optax.sgd(1e-1)).
+
+    Args:
+        solver: The linear solver used when there is no closed-form Fisher information, which is
+            conjugate gradient by default.
+    """
+    def init_fn(params: optax.Params) -> optax.OptState:
+        return optax.EmptyState()
+
+    def update_fn(updates: optax.Updates,
+                  state: optax.OptState,
+                  params: optax.Params | None = None
+                  ) -> tuple[optax.Updates, optax.OptState]:
+        if params is None:
+            raise ValueError(_no_params_message)
+        updates = tree.map(partial(_precondition, solver=solver), params, updates,
+                           is_leaf=lambda x: isinstance(x, NaturalParametrization))
+        return updates, state
+
+    return optax.GradientTransformation(init_fn, update_fn)
+
+
+def _precondition(q: Any, q_bar: Any, *, solver: lx.AbstractLinearSolver[Any] | None) -> Any:
+    if not isinstance(q, NaturalParametrization):
+        return q_bar
+    flattener, flattened = Flattener.flatten(q, map_to_plane=False)
+    # Pull the cotangent back to the flattened natural parameters, which counts each off-diagonal
+    # element of a symmetric matrix twice.
+    _, unflatten_vjp = vjp(flattener.unflatten, flattened)
+    flat_gradient, = unflatten_vjp(q_bar)
+    flat_direction = q._flat_inverse_fisher_apply(flat_gradient, solver)  # noqa: SLF001
+    # Push the direction forward so that the fixed parameters are not updated.
+    _, direction = jvp(flattener.unflatten, (flattened,), (flat_direction,))
+    return tree.map(lambda x, y: (jnp.zeros_like(y) if x.dtype == float0 else x), direction, q)
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import math
 from abc import abstractmethod
+from functools import partial
 from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, final, get_type_hints
 
+import jax
 import jax.numpy as jnp
-from jax import grad, jacfwd, vjp, vmap
-from tjax import (JaxAbstractClass, JaxComplexArray, JaxRealArray, abstract_custom_jvp,
-                  abstract_jit, jit)
+import lineax as lx
+from jax import grad, jacfwd, jvp, lax, vjp, vmap
+from tjax import (JaxAbstractClass, JaxComplexArray, JaxIntegralArray, JaxRealArray, KeyArray,
+                  abstract_custom_jvp, abstract_jit, jit)
 from tjax.dataclasses import dataclass
 
 from .iteration import parameters
 from .parametrization import Distribution
 from .structure import Flattener, MaximumLikelihoodEstimator, Structure
-from .tools import parameter_dot_product
+from .tools import parameter_dot_product, parameter_reshape
 
 if TYPE_CHECKING:
     from .expectation_parametrization import ExpectationParametrization
@@ -20,6 +24,10 @@ if TYPE_CHECKING:
 
 EP = TypeVar('EP', bound='ExpectationParametrization[Any]')
 Domain = TypeVar('Domain', bound=JaxComplexArray | dict[str, Any])
+# The number of basis vectors whose Hessian-vector products are computed together.
+_fisher_diagonal_chunk_size = 32
+# The relative and absolute tolerance of the default solver of inverse_fisher_apply.
+_inverse_fisher_tolerance = 1e-6
 
 
 def log_normalizer_jvp(primals: tuple[NaturalParametrization[Any, Any]],
@@ -83,7 +91,7 @@ class NaturalParametrization(Distribution,
 
     @classmethod
     def expectation_parametrization_cls(cls) -> type[EP]:
-        return get_type_hints(cls.to_exp)['return']
+        return _expectation_parametrization_cls(cls)
 
     @jit
     @final
@@ -116,10 +124,57 @@ class NaturalParametrization(Distribution,
 
         See also: apply_fisher_information.
         """
-        flattener, _ = Flattener.flatten(self)
-        fisher_matrix = self._fisher_information_matrix()
-        fisher_diagonal = jnp.diagonal(fisher_matrix)
-        return flattener.unflatten(fisher_diagonal)
+        flattener, _ = Flattener.flatten(self, map_to_plane=False)
+        return flattener.unflatten(self.flat_fisher_information_diagonal())
+
+    def flat_fisher_information_diagonal(self) -> JaxRealArray:
+        """The diagonal of fisher_information_matrix.
+
+        If fisher_information_matrix has a closed form, this is its diagonal.  Otherwise, the
+        diagonal is computed with Hessian-vector products of the log-normalizer on chunks of basis
+        vectors so that the matrix is never materialized.  Distributions can override this with a
+        closed form.
+
+        Returns: An array of shape (*self.shape, k), where k is the number of flattened parameters.
+        """
+        if (type(self).fisher_information_matrix
+                is not NaturalParametrization.fisher_information_matrix):
+            return jnp.diagonal(self.fisher_information_matrix(), axis1=-2, axis2=-1)
+        flat_self = parameter_reshape(self, (math.prod(self.shape),))
+        diagonal = flat_self._flat_fisher_information_diagonal()  # noqa: SLF001
+        return jnp.reshape(diagonal, (*self.shape, diagonal.shape[-1]))
+
+    @final
+    def fisher_information_diagonal_estimate(self, key: KeyArray, samples: int = 16) -> Self:
+        """An unbiased stochastic estimate of the diagonal elements of the Fisher information.
+
+        This is Hutchinson's estimator, which averages z * (F z) over Rademacher vectors z.  It
+        costs one Hessian-vector product per sample rather than one per parameter.
+
+        Args:
+            key: The random key.
+            samples: The number of Rademacher vectors per distribution.
+
+        Returns: The estimate stored in a NaturalParametrization object whose fields are an array
+            of the same shape as self.
+        """
+        batch_size = math.prod(self.shape)
+        flat_self = parameter_reshape(self, (batch_size,))
+        flattener, flattened = Flattener.flatten(flat_self, map_to_plane=False)
+
+        def estimate(key: KeyArray, flattened: JaxRealArray, flattener: Flattener[Self]
+                     ) -> JaxRealArray:
+            gradient = partial(grad(self._flat_log_normalizer), flattener=flattener)
+            probes = jax.random.rademacher(key, (samples, *flattened.shape),
+                                           dtype=flattened.dtype)
+            _, products = vmap(lambda z: jvp(gradient, (flattened,), (z,)))(probes)
+            return jnp.mean(probes * products, axis=0)
+
+        keys = jax.random.split(key, batch_size)
+        diagonal = vmap(estimate)(keys, flattened, flattener)
+        diagonal = jnp.reshape(diagonal, (*self.shape, diagonal.shape[-1]))
+        flattener, _ = Flattener.flatten(self, map_to_plane=False)
+        return flattener.unflatten(diagonal)
 
     @final
     def fisher_information_trace(self) -> Self:
@@ -146,10 +201,31 @@ class NaturalParametrization(Distribution,
             final_parameters[path] = new_value
         return structure.assemble(final_parameters)
 
+    def fisher_information_matrix(self) -> JaxRealArray:
+        """The Fisher information with respect to the flattened natural parameters.
+
+        This is the Hessian of the log-normalizer with respect to the variable parameters as they
+        are flattened by Flattener without mapping to the plane.  It is computed by automatic
+        differentiation unless a distribution overrides it with a closed form.
+
+        Returns: An array of shape (*self.shape, k, k), where k is the number of flattened
+            parameters.
+        """
+        return self._fisher_information_matrix()
+
+    def log_jeffreys_prior(self) -> JaxRealArray:
+        """The logarithm of the unnormalized Jeffreys prior density.
+
+        This is half the log-determinant of fisher_information_matrix, which is found from its
+        Cholesky factor so that it neither overflows nor underflows.  Distributions can override
+        this with a closed form.
+        """
+        cholesky = jnp.linalg.cholesky(self.fisher_information_matrix())
+        return jnp.sum(jnp.log(jnp.diagonal(cholesky, axis1=-2, axis2=-1)), axis=-1)
+
     @final
     def jeffreys_prior(self) -> JaxRealArray:
-        fisher_matrix = self._fisher_information_matrix()
-        return jnp.sqrt(jnp.linalg.det(fisher_matrix))
+        return jnp.exp(self.log_jeffreys_prior())
 
     @jit
     @final
@@ -167,6 +243,41 @@ class NaturalParametrization(Distribution,
         expectation_parameters, f_vjp = vjp(type(self).to_exp, self)
         return expectation_parameters, f_vjp(vector)
 
+    @final
+    def fisher_operator(self) -> lx.FunctionLinearOperator:
+        """The Fisher information as a matrix-free linear operator.
+
+        The operator is the Hessian of the log-normalizer with respect to the flattened natural
+        parameters, which have shape (*self.shape, k), so it agrees with
+        fisher_information_matrix.  It is block diagonal over the batch, symmetric, and positive
+        semidefinite.
+
+        See also: fisher_information_matrix.
+        """
+        flattener, flattened = Flattener.flatten(self, map_to_plane=False)
+        return _fisher_operator(flattener, flattened)
+
+    @final
+    def inverse_fisher_apply(self, vector: EP, *, solver: lx.AbstractLinearSolver[Any] | None = None
+                             ) -> Self:
+        """Apply the inverse of the Fisher information to a vector without materializing it.
+
+        This is the inverse of apply_fisher_information, and it is used for natural gradients.
+        If fisher_information_matrix has a closed form and no solver is given, the closed form is
+        solved directly.  Otherwise, each element of the batch is solved separately using
+        fisher_operator.
+
+        Args:
+            vector: Some set of expectation parameters, e.g., a gradient.
+            solver: The linear solver, which is conjugate gradient by default.
+
+        Returns: The natural parameters whose flattened image under the Fisher information is the
+            flattened vector.
+        """
+        _, flat_vector = Flattener.flatten(vector, map_to_plane=False)
+        flattener, _ = Flattener.flatten(self, map_to_plane=False)
+        return flattener.unflatten(self._flat_inverse_fisher_apply(flat_vector, solver))
+
     @final
     def kl_divergence(self, q: Self) -> JaxRealArray:
         return self.to_exp().kl_divergence(q, self_nat=self)
@@ -179,10 +290,79 @@ class NaturalParametrization(Distribution,
         distribution = flattener.unflatten(flattened_parameters)
         return distribution.log_normalizer()
 
+    def _flat_inverse_fisher_apply(self,
+                                   flat_vector: JaxRealArray,
+                                   solver: lx.AbstractLinearSolver[Any] | None
+                                   ) -> JaxRealArray:
+        if (solver is None and type(self).fisher_information_matrix
+                is not NaturalParametrization.fisher_information_matrix):
+            solution = jnp.linalg.solve(self.fisher_information_matrix(),
+                                        flat_vector[..., jnp.newaxis])
+            return solution[..., 0]
+        if solver is None:
+            solver = lx.CG(rtol=_inverse_fisher_tolerance, atol=_inverse_fisher_tolerance)
+        batch_size = math.prod(self.shape)
+        flat_self = parameter_reshape(self, (batch_size,))
+        flattener, flattened = Flattener.flatten(flat_self, map_to_plane=False)
+
+        def solve(flattener: Flattener[Self], flattened: JaxRealArray, vector: JaxRealArray
+                  ) -> JaxRealArray:
+            return lx.linear_solve(_fisher_operator(flattener, flattened), vector, solver).value
+
+        solution = vmap(solve)(flattener, flattened,
+                               jnp.reshape(flat_vector, (batch_size, flat_vector.shape[-1])))
+        return jnp.reshape(solution, flat_vector.shape)
+
     @jit
+    def _flat_fisher_information_diagonal(self) -> JaxRealArray:
+        flattener, flattened = Flattener.flatten(self, map_to_plane=False)
+
+        def diagonal(flattened: JaxRealArray, flattener: Flattener[Self]) -> JaxRealArray:
+            gradient = partial(grad(self._flat_log_normalizer), flattener=flattener)
+            k = flattened.shape[-1]
+
+            def diagonal_element(i: JaxIntegralArray) -> JaxRealArray:
+                basis_vector = jnp.zeros_like(flattened).at[i].set(1.0)
+                _, product = jvp(gradient, (flattened,), (basis_vector,))
+                return product[i]
+
+            return lax.map(diagonal_element, jnp.arange(k), batch_size=_fisher_diagonal_chunk_size)
+        return vmap(diagonal)(flattened, flattener)
+
     def _fisher_information_matrix(self) -> JaxRealArray:
+        # Map over a single batch axis so that batches having the same number of elements share one
+        # compiled kernel regardless of their shape.
+        flat_self = parameter_reshape(self, (math.prod(self.shape),))
+        fisher_information = flat_self._flat_fisher_information_matrix()  # noqa: SLF001
+        return jnp.reshape(fisher_information, (*self.shape, *fisher_information.shape[1:]))
+
+    @jit
+    def _flat_fisher_information_matrix(self) -> JaxRealArray:
         flattener, flattened = Flattener.flatten(self, map_to_plane=False)
-        fisher_info_f = jacfwd(grad(self._flat_log_normalizer))
-        for _ in range(len(self.shape)):
-            fisher_info_f = vmap(fisher_info_f)
+        fisher_info_f = vmap(jacfwd(grad(self._flat_log_normalizer)))
         return fisher_info_f(flattened, flattener)
+
+
+def _fisher_operator(flattener: Flattener[Any], flattened: JaxRealArray
+                     ) -> lx.FunctionLinearOperator:
+    def flat_log_normalizer(flattened: JaxRealArray) -> JaxRealArray:
+        # The batch elements are independent, so the Hessian of the sum is block diagonal.
+        return jnp.sum(flattener.unflatten(flattened).log_normalizer())
+
+    _, fisher_vector_product = jax.linearize(grad(flat_log_normalizer), flattened)
+    return lx.FunctionLinearOperator(fisher_vector_product,
+                                     jax.ShapeDtypeStruct(flattened.shape, flattened.dtype),
+                                     tags=(lx.symmetric_tag, lx.positive_semidefinite_tag))
+
+
+# The cache of _expectation_parametrization_cls.  A dict is used rather than functools.cache since
+# classes do not type-check as Hashable.
+_expectation_parametrization_cls_cache: dict[type[Any], type[Any]] = {}
+
+
+def _expectation_parametrization_cls(cls: type[Any]) -> type[Any]:
+    # Resolving the type hints of to_exp is slow, so it is done once per class.
+    retval = _expectation_parametrization_cls_cache.get(cls)
+    if retval is None:
+        retval = _expectation_parametrization_cls_cache[cls] = get_type_hints(cls.to_exp)['return']
+    return retval
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from math import comb, sqrt
+from functools import cache
+from math import comb, isqrt
 from typing import Any, cast
 
 import jax.numpy as jnp
@@ -10,6 +11,7 @@ import numpy as np
 from jax.dtypes import canonicalize_dtype
 from jax.scipy import special as jss
 from numpy.random import Generator
+from numpy.typing import NDArray
 from tjax import JaxArray, JaxComplexArray, JaxRealArray, Shape, inverse_softplus, softplus
 from tjax.dataclasses import field
 from typing_extensions import override
@@ -343,12 +345,24 @@ class SimplexSupport(Support):
 
 
 class SymmetricMatrixSupport(Support):
+    """The support of symmetric (or Hermitian) matrices.
+
+    Args:
+        positive_semidefinite: Whether the matrices are positive semidefinite.
+        negative_semidefinite: Whether the matrices are negative semidefinite.
+        hermitian: Whether the matrices are Hermitian rather than symmetric.
+        packed: Whether the parameter is stored as its packed upper triangle (see
+            pack_symmetric_matrix) rather than as a full matrix.  The packed representation holds
+            nearly half as many elements.  Matrices can be materialized with
+            unpack_symmetric_matrix where linear algebra needs them.
+    """
     @override
     def __init__(self,
                  *,
                  positive_semidefinite: bool = False,
                  negative_semidefinite: bool = False,
                  hermitian: bool = False,
+                 packed: bool = False,
                  **kwargs: Any) -> None:
         if hermitian:
             kwargs.setdefault('ring', complex_field)
@@ -356,14 +370,15 @@ class SymmetricMatrixSupport(Support):
         self.hermitian = hermitian
         self.positive_semidefinite = positive_semidefinite
         self.negative_semidefinite = negative_semidefinite
+        self.packed = packed
 
     @override
     def axes(self) -> int:
-        return 2
+        return 1 if self.packed else 2
 
     @override
     def shape(self, dimensions: int) -> Shape:
-        return (dimensions, dimensions)
+        return (comb(dimensions + 1, 2),) if self.packed else (dimensions, dimensions)
 
     @override
     def num_elements(self, dimensions: int) -> int:
@@ -371,29 +386,19 @@ class SymmetricMatrixSupport(Support):
 
     @override
     def flattened(self, x: JaxArray, *, map_to_plane: bool) -> JaxRealArray:
-        dimensions = x.shape[-1]
-        assert x.shape[-2] == dimensions
-        index = (..., *jnp.triu_indices(dimensions))
-        return self.ring.flattened(x[index], map_to_plane=map_to_plane)
+        if not self.packed:
+            x = pack_symmetric_matrix(x)
+        return self.ring.flattened(x, map_to_plane=map_to_plane)
 
     @override
     def unflattened(self, y: JaxRealArray, dimensions: int, *, map_from_plane: bool) -> JaxArray:
         x = self.ring.unflattened(y, map_from_plane=map_from_plane)
-        k = x.shape[-1]
-        sqrt_discriminant = sqrt(1 + 8 * k)
-        i_sqrt_discriminant = int(sqrt_discriminant)
-        if i_sqrt_discriminant != sqrt_discriminant:
-            msg = f"{k} {sqrt_discriminant}"
+        if x.shape[-1] != comb(dimensions + 1, 2):
+            msg = f"{x.shape[-1]} elements cannot be packed into a matrix of size {dimensions}"
             raise ValueError(msg)
-        if i_sqrt_discriminant % 2 != 1:
-            raise ValueError
-        dimensions = (i_sqrt_discriminant - 1) // 2
-        index = (..., *jnp.triu_indices(dimensions))
-        empty = jnp.empty(x.shape[:-1] + (dimensions, dimensions), dtype=x.dtype)
-        lower_diagonal = jnp.swapaxes(empty.at[index].set(x), -2, -1)
-        if self.hermitian:
-            lower_diagonal = lower_diagonal.conjugate()
-        return lower_diagonal.at[index].set(x)
+        if self.packed:
+            return x
+        return unpack_symmetric_matrix(x, hermitian=self.hermitian)
 
     @override
     def generate(self, rng: Generator, shape: Shape, dimensions: int) -> JaxRealArray:
@@ -406,8 +411,19 @@ class SymmetricMatrixSupport(Support):
             eig_field = (RealField(minimum=0.0)
                          if self.positive_semidefinite else RealField(maximum=0.0))
             eig = eig_field.generate(rng, (*shape, dimensions))
-            return jnp.einsum('...ij,...j,...jk->...ik', m, eig, mt)
-        return m + mt
+            x = jnp.einsum('...ij,...j,...jk->...ik', m, eig, mt)
+        else:
+            x = m + mt
+        return pack_symmetric_matrix(x) if self.packed else x
+
+    def packed_weights(self, dimensions: int) -> JaxRealArray:
+        """The weights of the packed elements in the dot product of two matrices.
+
+        The off-diagonal elements appear twice in the matrices, and once in the packed upper
+        triangle.
+        """
+        rows, columns = _upper_triangle_indices(dimensions)
+        return jnp.asarray(np.where(rows == columns, 1.0, 2.0))
 
 
 class SquareMatrixSupport(Support):
@@ -459,6 +475,56 @@ class CircularBoundedSupport(VectorSupport):
         return y * magnitude / corrected_magnitude
 
 
+def pack_symmetric_matrix(x: JaxArray) -> JaxArray:
+    """Pack the upper triangle of symmetric (or Hermitian) matrices into vectors.
+
+    Args:
+        x: An array of matrices having shape (..., n, n).
+    Returns: An array having shape (..., n * (n + 1) // 2) whose elements are ordered like
+        numpy.triu_indices.
+    """
+    dimensions = x.shape[-1]
+    assert x.shape[-2] == dimensions
+    index = (..., *_upper_triangle_indices(dimensions))
+    return x[index]
+
+
+def unpack_symmetric_matrix(x: JaxArray, *, hermitian: bool = False) -> JaxArray:
+    """Unpack vectors produced by pack_symmetric_matrix into symmetric (or Hermitian) matrices.
+
+    Args:
+        x: An array of packed upper triangles having shape (..., n * (n + 1) // 2).
+        hermitian: Whether the lower triangle is the conjugate of the upper triangle.
+    Returns: An array having shape (..., n, n).
+    """
+    k = x.shape[-1]
+    dimensions = (isqrt(1 + 8 * k) - 1) // 2
+    if comb(dimensions + 1, 2) != k:
+        msg = f"{k} elements cannot be packed into a square matrix"
+        raise ValueError(msg)
+    index, lower = _unpacking_indices(dimensions)
+    matrix = x[..., index]
+    if hermitian:
+        matrix = jnp.where(lower, matrix.conjugate(), matrix)
+    return matrix
+
+
+@cache
+def _upper_triangle_indices(dimensions: int) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+    return np.triu_indices(dimensions)
+
+
+@cache
+def _unpacking_indices(dimensions: int) -> tuple[NDArray[np.int_], NDArray[np.bool_]]:
+    """The gather index of each matrix element into the packed vector, and the lower mask."""
+    rows, columns = _upper_triangle_indices(dimensions)
+    index = np.empty((dimensions, dimensions), dtype=np.int32)
+    index[rows, columns] = np.arange(rows.shape[0])
+    index[columns, rows] = np.arange(rows.shape[0])
+    lower = np.tril(np.ones((dimensions, dimensions), dtype=np.bool_), k=-1)
+    return index, lower
+
+
 def distribution_parameter(support: Support,
                            *,
                            fixed: bool = False,
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import Mapping
+from operator import itemgetter
 from typing import Any, Self, override
 
+from jax import tree
 from tjax import JaxAbstractClass, JaxArray, Shape
 from tjax.dataclasses import dataclass
 
@@ -14,10 +16,9 @@ from .parameter import Support
 class Distribution(JaxAbstractClass):
     """The Distribution is the base class of all distributions."""
     def __getitem__(self, key: Any) -> Self:
-        from .iteration import parameters  # noqa: PLC0415
-        from .structure import Structure  # noqa: PLC0415
-        parameters_ = {path: value[key] for path, value in parameters(self).items()}
-        return Structure.create(self).assemble(parameters_)
+        # Every leaf is a parameter, so index the leaves under the cached tree structure rather than
+        # reassembling the distribution.
+        return tree.map(itemgetter(key), self)
 
     @abstractmethod
     def sub_distributions(self) -> Mapping[str, Distribution]:
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, TypeAlias
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from jax import ShapeDtypeStruct, export, jit, tree
+from jax._src.compilation_cache import reset_cache  # noqa: PLC2701
+from jax.typing import DTypeLike
+from tjax import Shape
+
+from .expectation_parametrization import ExpectationParametrization
+from .interfaces.multidimensional import Multidimensional
+from .iteration import parameters, support
+from .natural_parametrization import NaturalParametrization
+from .parameter import BooleanRing, ComplexField, IntegralRing, Ring, Support
+from .parametrization import SimpleDistribution
+
+_manifest_name = 'manifest.json'
+_compilation_cache_name = 'compilation_cache'
+# The methods of the natural parametrization that are exported, and whether they take an
+# observation.  The expectation parametrization's to_nat is exported too.
+_natural_methods = {'log_normalizer': False, 'to_exp': False, 'log_pdf': True}
+_default_methods = (*_natural_methods, 'to_nat')
+
+_Key: TypeAlias = tuple[type[SimpleDistribution], str, Shape, str, int]
+
+
+def enable_compilation_cache(path: Path | str) -> None:
+    """Configure JAX's persistent compilation cache to store every executable in a directory.
+
+    The cache is configured for the whole process: this updates the global JAX configuration, and
+    replaces any cache that was already in use, which JAX otherwise initializes only once.
+
+    Args:
+        path: The directory of the cache.
+    """
+    # JAX initializes its persistent cache once per process and ignores later changes to the cache
+    # directory, so reset it to have the new configuration take effect.
+    reset_cache()
+    jax.config.update('jax_compilation_cache_dir', str(path))
+    jax.config.update('jax_persistent_cache_min_compile_time_secs', 0.0)
+    jax.config.update('jax_persistent_cache_min_entry_size_bytes', 0)
+
+
+def precompile(families: Iterable[type[NaturalParametrization[Any, Any]]],
+               shapes: Iterable[Shape],
+               dtypes: Iterable[DTypeLike],
+               path: Path | str,
+               *,
+               dimensions: int = 1,
+               methods: Iterable[str] = _default_methods,
+               compile_cache: bool = True) -> None:
+    """Export the kernels of distribution families so that they can be loaded without tracing.
+
+    Each method of each family is exported for every batch shape and dtype using jax.export, and
+    serialized to the directory along with a manifest.  Use load_precompiled to rehydrate them.
+
+    Args:
+        families: The natural parametrizations of the families.  The to_nat kernel is exported for
+            the corresponding expectation parametrizations.
+        shapes: The batch shapes.
+        dtypes: The real dtypes of the parameters.
+        path: The directory in which to store the kernels.
+        dimensions: The number of dimensions of the multidimensional families.
+        methods: The methods to export, which are among log_normalizer, to_exp, log_pdf, and
+            to_nat.
+        compile_cache: Whether to also compile the kernels into a persistent compilation cache in
+            the directory so that loading them does not compile them.  This enables the cache for
+            the whole process (see enable_compilation_cache).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    if compile_cache:
+        enable_compilation_cache(path / _compilation_cache_name)
+    methods = tuple(methods)
+    manifest: list[dict[str, Any]] = []
+    for family in families:
+        exp_family = family.expectation_parametrization_cls()
+        for shape in shapes:
+            for dtype in dtypes:
+                dtype_name = np.dtype(dtype).name
+                for method in methods:
+                    cls = exp_family if method == 'to_nat' else family
+                    assert issubclass(cls, SimpleDistribution)
+                    dimensions_ = dimensions if issubclass(cls, Multidimensional) else 1
+                    args = _abstract_arguments(cls, method, shape, dtype, dimensions_)
+                    leaves, in_tree = tree.flatten(args)
+                    function = getattr(cls, method)
+
+                    def flat_function(*leaves: Any, in_tree: Any = in_tree,
+                                      function: Any = function) -> list[Any]:
+                        return tree.leaves(function(*tree.unflatten(in_tree, leaves)))
+
+                    exported = export.export(jit(flat_function))(*leaves)
+                    if compile_cache:
+                        jit(exported.call).lower(*leaves).compile()
+                    shape_name = 'x'.join(map(str, shape))
+                    file_name = (f"{cls.__qualname__}-{method}-{shape_name}-{dtype_name}-"
+                                 f"{dimensions_}.jaxexport")
+                    (path / file_name).write_bytes(exported.serialize())
+                    manifest.append({'module': cls.__module__,
+                                     'qualname': cls.__qualname__,
+                                     'method': method,
+                                     'shape': list(shape),
+                                     'dtype': dtype_name,
+                                     'dimensions': dimensions_,
+                                     'file': file_name})
+    (path / _manifest_name).write_text(json.dumps(manifest, indent=2))
+
+
+def load_precompiled(path: Path | str) -> PrecompiledKernels:
+    """Load the kernels exported by precompile.
+
+    If precompile compiled the kernels into a persistent compilation cache, the cache is enabled
+    for the whole process by enable_compilation_cache, which changes the global JAX configuration.
+
+    Args:
+        path: The directory passed to precompile.
+    """
+    path = Path(path)
+    if (path / _compilation_cache_name).is_dir():
+        enable_compilation_cache(path / _compilation_cache_name)
+    kernels: dict[_Key, export.Exported] = {}
+    for entry in json.loads((path / _manifest_name).read_text()):
+        cls = _import_class(entry['module'], entry['qualname'])
+        key = (cls, entry['method'], tuple(entry['shape']), entry['dtype'], entry['dimensions'])
+        kernels[key] = export.deserialize(bytearray((path / entry['file']).read_bytes()))
+    return PrecompiledKernels(kernels)
+
+
+class PrecompiledKernels:
+    """The kernels loaded by load_precompiled.
+
+    Calling a kernel whose distribution family, batch shape, dtype, and dimensions were not
+    exported falls back to calling the method directly.
+    """
+    def __init__(self, kernels: dict[_Key, export.Exported]) -> None:
+        super().__init__()
+        self.kernels = kernels
+
+    def __call__(self, method: str, p: SimpleDistribution, /, *args: Any) -> Any:
+        """Call a method of a distribution using an exported kernel.
+
+        Args:
+            method: The name of the method, e.g., 'log_pdf'.
+            p: The distribution.
+            args: The remaining arguments of the method.
+        """
+        dtype = next((leaf.dtype for leaf in tree.leaves(p)
+                      if jnp.issubdtype(leaf.dtype, jnp.inexact)),
+                     None)
+        if dtype is None:
+            return getattr(p, method)(*args)
+        dtype_name = np.dtype(jnp.finfo(dtype).dtype).name
+        dimensions = p.dimensions() if isinstance(p, Multidimensional) else 1
+        kernel = self.kernels.get((type(p), method, p.shape, dtype_name, dimensions))
+        if kernel is None:
+            return getattr(p, method)(*args)
+        outputs = kernel.call(*tree.leaves((p, *args)))
+        output_cls = _output_cls(type(p), method)
+        if output_cls is None:
+            output, = outputs
+            return output
+        output_tree = tree.structure(_abstract_distribution(output_cls, p.shape, dtype_name,
+                                                            dimensions))
+        return tree.unflatten(output_tree, outputs)
+
+    def __contains__(self, key: _Key) -> bool:
+        return key in self.kernels
+
+
+def _import_class(module_name: str, qualname: str) -> type[SimpleDistribution]:
+    cls: Any = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        cls = getattr(cls, name)
+    assert issubclass(cls, SimpleDistribution)
+    return cls
+
+
+def _output_cls(cls: type[SimpleDistribution], method: str) -> type[SimpleDistribution] | None:
+    if method == 'to_exp':
+        assert issubclass(cls, NaturalParametrization)
+        return cls.expectation_parametrization_cls()
+    if method == 'to_nat':
+        assert issubclass(cls, ExpectationParametrization)
+        return cls.natural_parametrization_cls()
+    return None
+
+
+def _abstract_arguments(cls: type[SimpleDistribution],
+                        method: str,
+                        shape: Shape,
+                        dtype: DTypeLike,
+                        dimensions: int) -> tuple[Any, ...]:
+    if method != 'to_nat' and method not in _natural_methods:
+        msg = f"Cannot export {method}"
+        raise ValueError(msg)
+    p = _abstract_distribution(cls, shape, dtype, dimensions)
+    if not _natural_methods.get(method):
+        return (p,)
+    x = _abstract_array(cls.domain_support(), shape, dtype, dimensions)
+    return (p, x)
+
+
+def _abstract_distribution(cls: type[SimpleDistribution],
+                           shape: Shape,
+                           dtype: DTypeLike,
+                           dimensions: int) -> Any:
+    kwargs = {name: _abstract_array(this_support, shape, dtype, dimensions)
+              for name, this_support in support(cls).items()}
+    retval = cls(**kwargs)
+    assert set(parameters(retval, recurse=False)) == set(kwargs)
+    return retval
+
+
+def _abstract_array(this_support: Support,
+                    shape: Shape,
+                    dtype: DTypeLike,
+                    dimensions: int) -> ShapeDtypeStruct:
+    return ShapeDtypeStruct((*shape, *this_support.shape(dimensions)),
+                            _ring_dtype(this_support.ring, dtype))
+
+
+def _ring_dtype(ring: Ring, dtype: DTypeLike) -> np.dtype[Any]:
+    real_dtype = np.dtype(dtype)
+    match ring:
+        case ComplexField():
+            return np.result_type(real_dtype, np.complex64)
+        case IntegralRing():
+            return np.dtype(f'int{real_dtype.itemsize * 8}')
+        case BooleanRing():
+            return np.dtype(np.bool_)
+        case _:
+            return real_dtype
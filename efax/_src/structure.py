@@ -1,6 +1,6 @@
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import replace
-from functools import partial, reduce
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, cast
 
 import jax.numpy as jnp
@@ -23,7 +23,55 @@ class SubDistributionInfo:
     path: Path = field(static=True)
     type_: type[Distribution] = field(static=True)
     dimensions: int = field(static=True)
-    sub_distribution_names: list[str] = field(static=True)
+    sub_distribution_names: tuple[str, ...] = field(static=True)
+
+
+@dataclass
+class FieldLayout:
+    """The static location of a variable parameter within a flattened array."""
+    name: str = field(static=True)
+    support: Support = field(static=True)
+    start: int = field(static=True)
+    stop: int = field(static=True)
+
+
+@dataclass
+class FlattenLayout:
+    """The static layout of the variable parameters of a structure within a flattened array.
+
+    It is computed once per sequence of distribution types and dimensions, so that unflattening
+    slices the flattened array at static offsets rather than walking the supports.
+    """
+    # The field layouts of each sub-distribution in post-order.
+    fields: tuple[tuple[FieldLayout, ...], ...] = field(static=True)
+    # Whether each sub-distribution adjusts its supports based on the values of its parameters.
+    adjusts_support: tuple[bool, ...] = field(static=True)
+    size: int = field(static=True)
+
+    @classmethod
+    @cache
+    def create(cls, types_and_dimensions: tuple[tuple[type[Distribution], int], ...]
+               ) -> 'FlattenLayout':
+        all_fields: list[tuple[FieldLayout, ...]] = []
+        adjusts_support: list[bool] = []
+        consumed = 0
+        for type_, dimensions in types_and_dimensions:
+            fields: list[FieldLayout] = []
+            for name, this_support in support(type_, fixed=False).items():
+                k = this_support.num_elements(dimensions)
+                fields.append(FieldLayout(name, this_support, consumed, consumed + k))
+                consumed += k
+            all_fields.append(tuple(fields))
+            adjusts_support.append(type_.adjust_support.__func__  # type: ignore[attr-defined]
+                                   is not Distribution.adjust_support.__func__)  # type: ignore[attr-defined]
+        return FlattenLayout(tuple(all_fields), tuple(adjusts_support), consumed)
+
+
+@cache
+def _intern_infos(infos: tuple[SubDistributionInfo, ...]) -> tuple[SubDistributionInfo, ...]:
+    # Return the first of the equal tuples so that structures with the same layout share their
+    # static information, and compare by identity.
+    return infos
 
 
 T = TypeVar('T')
@@ -42,9 +90,13 @@ class Structure(Generic[P]):
     * Generate a random set of parameters for a distribution having the saved structure.
 
     Structure is also the base class for Flattener.
+
+    The static information is immutable and interned so that structures with the same layout share
+    it.  This makes comparing and hashing the static side of a pytree cheap, so passing a structure
+    through a jit boundary hits the compilation cache.
     """
     # A post-order traversal of the tree.
-    infos: list[SubDistributionInfo] = field(static=True)
+    infos: tuple[SubDistributionInfo, ...] = field(static=True)
 
     @classmethod
     def create(cls, p: P) -> 'Structure[P]':
@@ -57,7 +109,7 @@ class Structure(Generic[P]):
             assert issubclass(info.type_, ExpectationParametrization)
             infos.append(SubDistributionInfo(info.path, info.type_.natural_parametrization_cls(),
                                              info.dimensions, info.sub_distribution_names))
-        return Structure(infos)
+        return Structure(_intern_infos(tuple(infos)))
 
     def to_exp(self) -> 'Structure[Any]':
         from .natural_parametrization import NaturalParametrization  # noqa: PLC0415
@@ -67,7 +119,7 @@ class Structure(Generic[P]):
             infos.append(SubDistributionInfo(info.path,
                                              info.type_.expectation_parametrization_cls(),
                                              info.dimensions, info.sub_distribution_names))
-        return Structure(infos)
+        return Structure(_intern_infos(tuple(infos)))
 
     def assemble(self, p: Mapping[Path, JaxComplexArray]) -> P:
         """Assemble a Distribution from its parameters using the saved structure."""
@@ -112,8 +164,8 @@ class Structure(Generic[P]):
         return self.assemble(path_and_values)
 
     @classmethod
-    def _extract_distributions(cls, p: P) -> list[SubDistributionInfo]:
-        return list(cls._walk(cls._make_info, p))
+    def _extract_distributions(cls, p: P) -> tuple[SubDistributionInfo, ...]:
+        return _intern_infos(tuple(cls._walk(cls._make_info, p)))
 
     @classmethod
     def _walk(cls,
@@ -131,7 +183,7 @@ class Structure(Generic[P]):
     def _make_info(cls, q: Distribution, path: Path) -> SubDistributionInfo:
         from .interfaces.multidimensional import Multidimensional  # noqa: PLC0415
         dimensions = q.dimensions() if isinstance(q, Multidimensional) else 1
-        sub_distribution_names = list(q.sub_distributions())
+        sub_distribution_names = tuple(q.sub_distributions())
         return SubDistributionInfo(path, type(q), dimensions, sub_distribution_names)
 
 
@@ -155,7 +207,7 @@ class MaximumLikelihoodEstimator(Structure[P]):
         from .expectation_parametrization import ExpectationParametrization  # noqa: PLC0415
         assert issubclass(type_p, ExpectationParametrization)
         return MaximumLikelihoodEstimator(
-                [SubDistributionInfo((), type_p, 0, [])],
+                _intern_infos((SubDistributionInfo((), type_p, 0, ()),)),
                 {(name,): value for name, value in fixed_parameters.items()})
 
     @classmethod
@@ -237,21 +289,22 @@ class Flattener(MaximumLikelihoodEstimator[P]):
         Args:
             flattened: The flattened array.
         """
-        consumed = 0
+        layout = self.layout()
+        if flattened.shape[-1] != layout.size:
+            raise ValueError('Incompatible array')  # noqa: TRY003
         constructed: dict[Path, Distribution] = {}
-        available = flattened.shape[-1]
-        for info in self.infos:
+        for info, field_layouts, adjusts_support in zip(self.infos, layout.fields,
+                                                        layout.adjusts_support, strict=True):
             regular_kwargs: dict[str, JaxArray] = {}
-            for name in support(info.type_, fixed=False):
-                this_support = info.type_.adjust_support(name, **regular_kwargs)
-                k = this_support.num_elements(info.dimensions)
-                if consumed + k > available:
-                    raise ValueError('Incompatible array')  # noqa: TRY003
+            for field_layout in field_layouts:
+                name = field_layout.name
+                this_support = (info.type_.adjust_support(name, **regular_kwargs)
+                                if adjusts_support
+                                else field_layout.support)
                 regular_kwargs[name] = this_support.unflattened(
-                        flattened[..., consumed: consumed + k],
+                        flattened[..., field_layout.start: field_layout.stop],
                         info.dimensions,
                         map_from_plane=self.mapped_to_plane)
-                consumed += k
             kwargs: dict[str, Distribution | JaxComplexArray | dict[str, Any]] = dict(
                     regular_kwargs)
             for name in support(info.type_, fixed=True):
@@ -261,10 +314,12 @@ class Flattener(MaximumLikelihoodEstimator[P]):
             if sub_distributions:
                 kwargs['_sub_distributions'] = sub_distributions
             constructed[info.path] = info.type_(**kwargs)
-        if consumed != available:
-            raise ValueError('Incompatible array')  # noqa: TRY003
         return cast(P, constructed[()])
 
+    def layout(self) -> FlattenLayout:
+        """The static layout of the variable parameters within a flattened array."""
+        return FlattenLayout.create(tuple((info.type_, info.dimensions) for info in self.infos))
+
     @classmethod
     def flatten(cls,
                 p: P,
@@ -283,7 +338,7 @@ class Flattener(MaximumLikelihoodEstimator[P]):
         arrays = [x
                   for xs in cls._walk(partial(cls._make_flat, map_to_plane=map_to_plane), p)
                   for x in xs]
-        flattened_array = reduce(partial(jnp.append, axis=-1), arrays)
+        flattened_array = jnp.concatenate(arrays, axis=-1)
         return (cls(cls._extract_distributions(p),
                     parameters(p, fixed=True),
                     map_to_plane),
@@ -307,7 +362,7 @@ class Flattener(MaximumLikelihoodEstimator[P]):
             raise ValueError
         info = cls._make_info(p, path=())
         info = replace(info, type_=q_cls)
-        infos = [info]
+        infos = _intern_infos((info,))
         fixed_parameters = parameters(p, fixed=True, support=False)
         return Flattener(infos, fixed_parameters, mapped_to_plane)
 
@@ -1,32 +1,34 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Mapping
-from functools import reduce
-from itertools import starmap
+from collections.abc import Callable, Mapping, Sequence
+from functools import cache
+from math import isqrt
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import jax.numpy as jnp
+from jax import custom_jvp, tree
+from jax.tree_util import PyTreeDef
+from jax.scipy import special as jss
 from tensorflow_probability.substrates import jax as tfp
-from tjax import JaxComplexArray, JaxRealArray
+from tjax import JaxArray, JaxBooleanArray, JaxComplexArray, JaxRealArray, Shape
 
 from .iteration import parameters
+from .parameter import SymmetricMatrixSupport
 from .parametrization import Distribution
 from .structure import Structure
 from .types import Axis
 
 
 def parameter_dot_product(x: NaturalParametrization[Any, Any], y: Any, /) -> JaxRealArray:
-    """Return the vectorized dot product over all of the variable parameters."""
-    def dotted_fields() -> Iterable[JaxRealArray]:
-        xs = parameters(x, fixed=False, support=True).values()
-        ys = parameters(y, fixed=False, support=True).values()
+    """Return the vectorized dot product over all of the variable parameters.
 
-        for (x_value, x_support), (y_value, y_support) in zip(xs, ys, strict=True):
-            axes = x_support.axes()
-            assert y_support.axes() == axes
-            yield _parameter_dot_product(x_value, y_value, axes)
-    return reduce(jnp.add, dotted_fields())
+    The variable parameters of each operand are viewed as one flat vector so that the dot product
+    is a single contraction rather than one per field.
+    """
+    x_flat = _flat_variable_parameters(x, weighted=True)
+    y_flat = _flat_variable_parameters(y, weighted=False)
+    return jnp.sum(x_flat * y_flat, axis=-1).real
 
 
 T = TypeVar('T', bound=Distribution)
@@ -46,14 +48,110 @@ def parameter_map(operation: Callable[..., JaxComplexArray],
                   *ys: Distribution
                   ) -> T:
     """Return a new distribution created by operating on the variable fields of the inputs."""
-    paths = parameters(x, fixed=False).keys()
-    iterators = [parameters(y, fixed=False).values()  # type: ignore[call-overload]
-                 for y in (x, *ys)]
-    final_values = list(starmap(operation, zip(*iterators, strict=True)))
-    operated_fields = dict(zip(paths, final_values, strict=True))
+    x_leaves, x_tree = tree.flatten(x)
+    ys_leaves = [tree.leaves(y) for y in ys]
+    ys_indices = [_variable_leaf_indices(tree.structure(y)) for y in ys]
+    for i, x_index in enumerate(_variable_leaf_indices(x_tree)):
+        x_leaves[x_index] = operation(
+                x_leaves[x_index],
+                *[y_leaves[y_indices[i]] for y_leaves, y_indices in zip(ys_leaves, ys_indices,
+                                                                        strict=True)])
+    return tree.unflatten(x_tree, x_leaves)
+
+
+def parameter_take(x: T, indices: JaxArray, /, *, axis: int = 0) -> T:
+    """Return the distributions at the given indices along a batch axis.
+
+    Args:
+        x: The distributions.
+        indices: An integer array of indices.
+        axis: The batch axis along which to take.
+    """
+    axis = _batch_axis(x, axis)
+    return tree.map(lambda value: jnp.take(value, indices, axis=axis), x)
+
+
+def parameter_where(condition: JaxBooleanArray, x: T, y: T, /) -> T:
+    """Return the distributions from x where the condition holds, and from y elsewhere.
+
+    Args:
+        condition: A Boolean array that broadcasts to the batch shape.
+        x: The distributions that are chosen where the condition holds.
+        y: The distributions that are chosen elsewhere.
+    """
+    condition = jnp.broadcast_to(condition, x.shape)
+
+    def f(x_value: JaxArray, y_value: JaxArray) -> JaxArray:
+        event_axes = x_value.ndim - x.ndim
+        expanded_condition = jnp.reshape(condition, condition.shape + (1,) * event_axes)
+        return jnp.where(expanded_condition, x_value, y_value)
+    return tree.map(f, x, y)
+
+
+def parameter_set(x: T, key: Any, y: T, /) -> T:
+    """Return x with the distributions at the given batch index replaced by y.
 
-    fixed_parameters = parameters(x, fixed=True)
-    return Structure.create(x).assemble({**fixed_parameters, **operated_fields})
+    This is the distribution equivalent of x.at[key].set(y).
+
+    Args:
+        x: The distributions.
+        key: An index into the batch shape.
+        y: The replacement distributions, whose shape broadcasts to that of x[key].
+    """
+    return tree.map(lambda x_value, y_value: x_value.at[key].set(y_value), x, y)
+
+
+def parameter_stack(xs: Sequence[T], /, *, axis: int = 0) -> T:
+    """Return the distributions stacked along a new batch axis.
+
+    Args:
+        xs: The distributions, which share their structure and shape.
+        axis: The position of the new batch axis.
+    """
+    x = xs[0]
+    if not -x.ndim - 1 <= axis <= x.ndim:
+        msg = f"Axis {axis} is out of bounds for stacking distributions with shape {x.shape}"
+        raise ValueError(msg)
+    axis %= x.ndim + 1
+    return tree.map(lambda *values: jnp.stack(values, axis=axis), *xs)
+
+
+def parameter_concatenate(xs: Sequence[T], /, *, axis: int = 0) -> T:
+    """Return the distributions concatenated along an existing batch axis.
+
+    Args:
+        xs: The distributions, which share their structure.
+        axis: The batch axis along which to concatenate.
+    """
+    axis = _batch_axis(xs[0], axis)
+    return tree.map(lambda *values: jnp.concatenate(values, axis=axis), *xs)
+
+
+def parameter_reshape(x: T, shape: Shape, /) -> T:
+    """Return the distributions with their batch shape reshaped.
+
+    Args:
+        x: The distributions.
+        shape: The new batch shape, which may contain one -1.
+    """
+    return tree.map(lambda value: jnp.reshape(value, (*shape, *value.shape[x.ndim:])), x)
+
+
+def parameter_broadcast_to(x: T, shape: Shape, /) -> T:
+    """Return the distributions with their batch shape broadcast to a shape.
+
+    Args:
+        x: The distributions.
+        shape: The new batch shape.
+    """
+    return tree.map(lambda value: jnp.broadcast_to(value, (*shape, *value.shape[x.ndim:])), x)
+
+
+def _batch_axis(x: Distribution, axis: int) -> int:
+    if not -x.ndim <= axis < x.ndim:
+        msg = f"Axis {axis} is out of bounds for a distribution with shape {x.shape}"
+        raise ValueError(msg)
+    return axis % x.ndim
 
 
 _T = TypeVar('_T')
@@ -79,11 +177,58 @@ iv_ratio = tfp.math.bessel_iv_ratio
 log_ive = tfp.math.log_bessel_ive
 
 
+@custom_jvp
+def inverse_digamma(y: JaxRealArray, /) -> JaxRealArray:
+    """Return the inverse of the digamma function restricted to the positive reals.
+
+    This uses Minka's initialization followed by a fixed number of Newton's method steps, which
+    reach machine precision.
+    """
+    y = jnp.asarray(y)
+    euler_mascheroni = -jss.digamma(1.0)
+    x = jnp.where(y >= -2.22,  # noqa: PLR2004
+                  jnp.exp(y) + 0.5,
+                  -1.0 / (y + euler_mascheroni))
+    for _ in range(_inverse_digamma_newton_steps):
+        x -= (jss.digamma(x) - y) / jss.polygamma(1, x)
+    return x
+
+
+@inverse_digamma.defjvp
+def _inverse_digamma_jvp(primals: tuple[JaxRealArray], tangents: tuple[JaxRealArray]
+                         ) -> tuple[JaxRealArray, JaxRealArray]:
+    y, = primals
+    y_dot, = tangents
+    x = inverse_digamma(y)
+    return x, y_dot / jss.polygamma(1, x)
+
+
 # Private functions --------------------------------------------------------------------------------
-def _parameter_dot_product(x: JaxComplexArray, y: JaxComplexArray, n_axes: int) -> JaxRealArray:
-    """Returns the real component of the dot product of the final n_axes axes of two arrays."""
-    axes = tuple(range(-n_axes, 0))
-    return jnp.sum(x * y, axis=axes).real
+_inverse_digamma_newton_steps = 5
+
+
+def _flat_variable_parameters(x: Distribution, *, weighted: bool) -> JaxComplexArray:
+    """Returns the variable parameters of x concatenated along a single event axis."""
+    values: list[JaxComplexArray] = []
+    for value, support in parameters(x, fixed=False, support=True).values():
+        event_shape = value.shape[value.ndim - support.axes():]
+        if weighted and isinstance(support, SymmetricMatrixSupport) and support.packed:
+            # Each off-diagonal element of the packed upper triangle stands for two elements.
+            weighted_value = support.packed_weights(isqrt(2 * event_shape[0])) * value
+        else:
+            weighted_value = value
+        broadcast_value = jnp.broadcast_to(weighted_value, (*x.shape, *event_shape))
+        values.append(jnp.reshape(broadcast_value, (*x.shape, -1)))
+    return jnp.concatenate(values, axis=-1)
+
+
+@cache
+def _variable_leaf_indices(treedef: PyTreeDef) -> tuple[int, ...]:
+    """Returns the indices of the leaves of a distribution's tree that are variable parameters."""
+    # Parameters are the only leaves, so label each leaf with its index, and read back the labels
+    # of the variable parameters.
+    labelled = tree.unflatten(treedef, range(treedef.num_leaves))
+    return tuple(int(index) for index in parameters(labelled, fixed=False).values())
 
 
 if TYPE_CHECKING:
@@ -3,13 +3,16 @@
 This example illustrates how this library fits in a typical machine learning context.  Suppose we
 have an unknown target value, and a loss function based on the cross-entropy between the target
 value and a predictive distribution.  We will optimize the predictive distribution by a small
-fraction of its cotangent.
+fraction of its cotangent.  Then, we will optimize it by natural-gradient descent using optax.
 """
+from typing import cast
+
 import jax.numpy as jnp
+import optax
 from jax import grad, lax
-from tjax import JaxBooleanArray, JaxRealArray, jit, print_generic
+from tjax import JaxBooleanArray, JaxIntegralArray, JaxRealArray, jit, print_generic
 
-from efax import BernoulliEP, BernoulliNP, parameter_dot_product, parameter_map
+from efax import BernoulliEP, BernoulliNP, natural_gradient, parameter_dot_product, parameter_map
 
 
 def cross_entropy_loss(p: BernoulliEP, q: BernoulliNP) -> JaxRealArray:
@@ -61,3 +64,26 @@ print_generic(predictive_distribution.to_exp())
 # BernoulliEP
 # └── probability=Jax Array (3,) float32
 #     └──  0.3007 │ 0.4002 │ 0.6993
+
+# Natural-gradient descent multiplies the cotangent by the inverse Fisher information, which is a
+# mirror descent step in the expectation parameters.  It converges in a handful of steps.
+optimizer = optax.chain(natural_gradient(), optax.sgd(1.0))
+
+
+def natural_body_fun(i: JaxIntegralArray, carry: tuple[BernoulliNP, optax.OptState]
+                     ) -> tuple[BernoulliNP, optax.OptState]:
+    q, state = carry
+    q_bar = gradient_cross_entropy(target_distribution, q)
+    # Distributions are pytrees, but optax's parameter type only names arrays and containers.
+    params = cast('optax.Params', q)
+    updates, state = optimizer.update(q_bar, state, params)
+    return cast('BernoulliNP', optax.apply_updates(params, updates)), state
+
+
+initial_state = optimizer.init(cast('optax.Params', initial_predictive_distribution))
+predictive_distribution, _ = lax.fori_loop(0, 5, natural_body_fun,
+                                           (initial_predictive_distribution, initial_state))
+print_generic(predictive_distribution)
+# BernoulliNP
+# └── log_odds=Jax Array (3,) float32
+#     └──  -0.8473 │ -0.4055 │ 0.8473
@@ -19,9 +19,10 @@ from efax import (BernoulliEP, BernoulliNP, BetaEP, BetaNP, ChiEP, ChiNP, ChiSqu
                   LogarithmicEP, LogarithmicNP, MultivariateDiagonalNormalEP,
                   MultivariateDiagonalNormalNP, MultivariateFixedVarianceNormalEP,
                   MultivariateFixedVarianceNormalNP, MultivariateNormalEP, MultivariateNormalNP,
-                  MultivariateUnitNormalEP, MultivariateUnitNormalNP, NegativeBinomialEP,
-                  NegativeBinomialNP, NormalEP, NormalNP, PoissonEP, PoissonNP, RayleighEP,
-                  RayleighNP, ScipyComplexMultivariateNormal, ScipyComplexNormal, ScipyDirichlet,
+                  MultivariatePackedNormalEP, MultivariatePackedNormalNP, MultivariateUnitNormalEP,
+                  MultivariateUnitNormalNP, NegativeBinomialEP, NegativeBinomialNP, NormalEP,
+                  NormalNP, PoissonEP, PoissonNP, RayleighEP, RayleighNP,
+                  ScipyComplexMultivariateNormal, ScipyComplexNormal, ScipyDirichlet,
                   ScipyGeneralizedDirichlet, ScipyGeometric, ScipyJointDistribution,
                   ScipyMultivariateNormal, ScipyVonMises, ScipyVonMisesFisher, Structure,
                   SubDistributionInfo, UnitNormalEP, UnitNormalNP, VonMisesFisherEP,
@@ -225,6 +226,23 @@ class MultivariateNormalInfo(DistributionInfo[MultivariateNormalNP, Multivariate
         return MultivariateNormalNP
 
 
+class MultivariatePackedNormalInfo(DistributionInfo[MultivariatePackedNormalNP,
+                                                    MultivariatePackedNormalEP, NumpyRealArray]):
+    @override
+    def exp_to_scipy_distribution(self, p: MultivariatePackedNormalEP) -> Any:
+        mean = np.asarray(p.mean, dtype=np.float64)
+        covariance = np.asarray(p.variance(), dtype=np.float64)
+        return ScipyMultivariateNormal.from_mc(mean=mean, cov=covariance)
+
+    @override
+    def exp_class(self) -> type[MultivariatePackedNormalEP]:
+        return MultivariatePackedNormalEP
+
+    @override
+    def nat_class(self) -> type[MultivariatePackedNormalNP]:
+        return MultivariatePackedNormalNP
+
+
 class ComplexUnitNormalInfo(DistributionInfo[ComplexUnitNormalNP, ComplexUnitNormalEP,
                                              NumpyComplexArray]):
     @override
@@ -501,8 +519,8 @@ class JointInfo(DistributionInfo[JointDistributionN, JointDistributionE, dict[st
                                               sub_info.sub_distribution_names)
                           for sub_info in info.exp_structure().infos])
         infos.append(SubDistributionInfo((), self.exp_class(), self.dimensions,
-                                         list(self.infos.keys())))
-        return Structure(infos)
+                                         tuple(self.infos.keys())))
+        return Structure(tuple(infos))
 
     @override
     def nat_structure(self) -> Structure[JointDistributionN]:
@@ -514,8 +532,8 @@ class JointInfo(DistributionInfo[JointDistributionN, JointDistributionE, dict[st
                                               sub_info.sub_distribution_names)
                           for sub_info in info.nat_structure().infos])
         infos.append(SubDistributionInfo((), self.nat_class(), self.dimensions,
-                                         list(self.infos.keys())))
-        return Structure(infos)
+                                         tuple(self.infos.keys())))
+        return Structure(tuple(infos))
 
     @override
     def exp_class(self) -> type[JointDistributionE]:
@@ -546,6 +564,7 @@ def create_infos() -> list[DistributionInfo[Any, Any, Any]]:
             MultivariateDiagonalNormalInfo(dimensions=4),
             MultivariateFixedVarianceNormalInfo(dimensions=2),
             MultivariateNormalInfo(dimensions=4),
+            MultivariatePackedNormalInfo(dimensions=4),
             MultivariateUnitNormalInfo(dimensions=5),
             NegativeBinomialInfo(),
             JointInfo(infos={'gamma': GammaInfo(), 'normal': NormalInfo()}),
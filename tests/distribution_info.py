@@ -59,10 +59,10 @@ class DistributionInfo(Generic[NP, EP, Domain]):
         return jnp.asarray(x)
 
     def exp_structure(self) -> Structure[EP]:
-        return Structure([SubDistributionInfo((), self.exp_class(), self.dimensions, [])])
+        return Structure((SubDistributionInfo((), self.exp_class(), self.dimensions, ()),))
 
     def nat_structure(self) -> Structure[NP]:
-        return Structure([SubDistributionInfo((), self.nat_class(), self.dimensions, [])])
+        return Structure((SubDistributionInfo((), self.nat_class(), self.dimensions, ()),))
 
     def exp_class(self) -> type[EP]:
         raise NotImplementedError
@@ -0,0 +1,42 @@
+"""These tests are related to the shape-bucketed dispatch of distribution methods."""
+from __future__ import annotations
+
+import jax.numpy as jnp
+from tjax import assert_tree_allclose
+
+from efax import GammaEP, NormalEP, NormalNP, bucketed, parameter_reshape
+
+
+def test_bucket_sizes() -> None:
+    """Test the choice of buckets."""
+    f = bucketed(NormalNP.log_normalizer)
+    assert [f.bucket_size(n) for n in [1, 8, 9, 100]] == [8, 8, 16, 128]
+    g = bucketed(NormalNP.log_normalizer, bucket_sizes=[10, 100])
+    assert [g.bucket_size(n) for n in [1, 10, 11, 250]] == [10, 10, 100, 300]
+
+
+def test_bucketed_methods() -> None:
+    """Test that bucketed methods match the originals and compile once per bucket."""
+    log_normalizer = bucketed(NormalNP.log_normalizer)
+    log_pdf = bucketed(NormalNP.log_pdf)
+    for n in [3, 5, 7]:
+        q = NormalNP(jnp.linspace(-1.0, 1.0, n), -jnp.linspace(0.5, 2.0, n))
+        x = jnp.linspace(-2.0, 2.0, n)
+        assert_tree_allclose(log_normalizer(q), q.log_normalizer())
+        assert_tree_allclose(log_pdf(q, x), q.log_pdf(x))
+    q = parameter_reshape(q, (7, 1))
+    assert_tree_allclose(log_normalizer(q), q.log_normalizer())
+    assert log_normalizer.cache_size() == 1
+    assert log_pdf.cache_size() == 1
+
+
+def test_bucketed_to_nat() -> None:
+    """Test that padding does not disturb the distributions that are solved."""
+    to_nat = bucketed(GammaEP.to_nat)
+    mean = jnp.linspace(0.5, 2.0, 5)
+    p = GammaEP(mean, jnp.log(mean) - 0.5)
+    assert_tree_allclose(to_nat(p), p.to_nat())
+    kl_divergence = bucketed(NormalEP.kl_divergence)
+    r = NormalEP(jnp.zeros(5), jnp.linspace(1.0, 2.0, 5))
+    s = NormalNP(jnp.ones(5), -jnp.ones(5))
+    assert_tree_allclose(kl_divergence(r, s), r.kl_divergence(s))
@@ -8,9 +8,10 @@ from jax import grad, jvp, vjp
 from jax.custom_derivatives import zero_from_primal
 from numpy.random import Generator
 from numpy.testing import assert_allclose
-from tjax import JaxRealArray, assert_tree_allclose, jit
+from tjax import JaxComplexArray, JaxRealArray, assert_tree_allclose, jit
 
-from efax import NaturalParametrization, Structure, parameters
+from efax import (ExpectationParametrization, NaturalParametrization, Structure,
+                  SymmetricMatrixSupport, parameters)
 
 from .create_info import BetaInfo, DirichletInfo, GammaInfo, GeneralizedDirichletInfo
 from .distribution_info import DistributionInfo
@@ -54,6 +55,15 @@ def prelude(generator: Generator,
     return original_ln, optimized_ln
 
 
+def _unweighted_gradient(gradient: ExpectationParametrization[Any], dimensions: int
+                         ) -> dict[tuple[str, ...], JaxComplexArray]:
+    # The gradient with respect to a packed upper triangle counts each off-diagonal element twice.
+    return {path: (value / support.packed_weights(dimensions)
+                   if isinstance(support, SymmetricMatrixSupport) and support.packed
+                   else value)
+            for path, (value, support) in parameters(gradient, fixed=False, support=True).items()}
+
+
 def test_gradient_log_normalizer_primals(generator: Generator,
                                          distribution_info: DistributionInfo[Any, Any, Any]
                                          ) -> None:
@@ -70,12 +80,14 @@ def test_gradient_log_normalizer_primals(generator: Generator,
         # Original GLN.
         origianl_gln_np = original_gln(generated_np)
         original_gln_ep = structure_ep.reinterpret(origianl_gln_np)
-        original_gln_parameters = parameters(original_gln_ep, fixed=False)
+        original_gln_parameters = _unweighted_gradient(original_gln_ep,
+                                                       distribution_info.dimensions)
 
         # Optimized GLN.
         optimized_gln_np = optimized_gln(generated_np)
         optimized_gln_ep = structure_ep.reinterpret(optimized_gln_np)
-        optimized_gln_parameters = parameters(optimized_gln_ep, fixed=False)
+        optimized_gln_parameters = _unweighted_gradient(optimized_gln_ep,
+                                                        distribution_info.dimensions)
 
         # Test primal evaluation.
         # parameters(generated_ep, fixed=False)
@@ -0,0 +1,257 @@
+"""These tests are related to the ExpToNat mixin and its minimizers."""
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from typing import Any
+
+import jax.numpy as jnp
+import pytest
+from jax import grad, log_compiles
+from jax.test_util import check_grads
+from numpy.random import Generator
+from tjax import JaxRealArray, assert_tree_allclose
+
+from efax import (DirichletEP, DirichletMinimizer, DirichletNP, Flattener, GammaEP, GammaNP,
+                  GeneralizedDirichletMinimizer, GeneralizedDirichletNP, NaturalParametrization,
+                  NewtonMinimizer, VonMisesFisherMinimizer, VonMisesFisherNP, parameter_reshape)
+
+from .create_info import (BetaInfo, DirichletInfo, GammaInfo, GeneralizedDirichletInfo,
+                          LogarithmicInfo, VonMisesFisherInfo)
+from .distribution_info import DistributionInfo
+
+
+def _near_boundary_parameters() -> dict[str, NaturalParametrization[Any, Any]]:
+    return {'Dirichlet': DirichletNP(jnp.asarray([[-0.95, -0.9, 30.0],
+                                                  [50.0, 60.0, 1.0],
+                                                  [0.0, 0.0, 0.0]])),
+            'GeneralizedDirichlet': GeneralizedDirichletNP(jnp.asarray([[-0.9, 3.0], [40.0, 0.5]]),
+                                                           jnp.asarray([[0.5, 20.0], [0.2, 3.0]])),
+            'VonMisesFisher': VonMisesFisherNP(jnp.asarray([[1e-2, 0.0, 0.0],
+                                                            [50.0, 20.0, 3.0],
+                                                            [1.0, 1.0, 1.0]]))}
+
+
+@pytest.mark.parametrize('name', ['Dirichlet', 'GeneralizedDirichlet', 'VonMisesFisher'])
+def test_newton_near_boundary(distribution_name: str | None, name: str) -> None:
+    """Test that the Newton minimizer inverts parameters that are close to the boundary."""
+    if distribution_name is not None and distribution_name != name:
+        pytest.skip(f"Deselected {name}")
+    nat_parameters = _near_boundary_parameters()[name]
+    minimizer = NewtonMinimizer()
+    exp_parameters = replace(nat_parameters.to_exp(), minimizer=minimizer)
+    search_parameters, info = minimizer.solve_batch(exp_parameters,
+                                                    exp_parameters.initial_search_parameters())
+    final_ep = exp_parameters.search_to_natural(search_parameters).to_exp()
+    assert_tree_allclose(final_ep, nat_parameters.to_exp(), atol=1e-6, rtol=1e-6)
+    assert jnp.all(info.converged)
+
+
+@pytest.mark.parametrize('info', [DirichletInfo(dimensions=5),
+                                  GeneralizedDirichletInfo(dimensions=5),
+                                  VonMisesFisherInfo(dimensions=5)],
+                         ids=lambda info: info.name())
+def test_newton_round_trip(generator: Generator,
+                           distribution_name: str | None,
+                           info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the Newton minimizer inverts randomly generated parameters."""
+    info.skip_if_deselected(distribution_name)
+    nat_parameters = info.nat_parameter_generator(generator, shape=(20,))
+    minimizer = NewtonMinimizer()
+    exp_parameters = replace(nat_parameters.to_exp(), minimizer=minimizer)
+    search_parameters, _ = minimizer.solve_batch(exp_parameters,
+                                                 exp_parameters.initial_search_parameters())
+    final_ep = exp_parameters.search_to_natural(search_parameters).to_exp()
+    assert_tree_allclose(final_ep, nat_parameters.to_exp(), atol=1e-4, rtol=1e-4)
+
+
+def test_newton_iterations(generator: Generator, distribution_name: str | None) -> None:
+    """Test that the Newton minimizer needs far fewer iterations than the Adam minimizer.
+
+    The Adam minimizer typically needs hundreds of its 1000 steps.
+    """
+    DirichletInfo.skip_if_deselected(distribution_name)
+    nat_parameters = DirichletInfo(dimensions=5).nat_parameter_generator(generator, shape=(20,))
+    minimizer = NewtonMinimizer()
+    exp_parameters = replace(nat_parameters.to_exp(), minimizer=minimizer)
+    _, info = minimizer.solve_batch(exp_parameters, exp_parameters.initial_search_parameters())
+    assert jnp.all(info.converged)
+    assert jnp.max(info.num_steps) < 50  # noqa: PLR2004
+
+
+def test_warm_start(generator: Generator,
+                    distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that warm-starting the default minimizer at the solution takes fewer steps."""
+    nat_parameters = distribution_info.nat_parameter_generator(generator, shape=(20,))
+    exp_parameters = nat_parameters.to_exp()
+    if not hasattr(exp_parameters, 'to_nat_with_info'):
+        pytest.skip("The expectation parametrization has a closed-form to_nat")
+    solution, cold_info = exp_parameters.to_nat_with_info()
+    warm_solution, warm_info = exp_parameters.to_nat_with_info(solution)
+    assert_tree_allclose(warm_solution.to_exp(), exp_parameters, atol=1e-4, rtol=1e-4)
+    assert jnp.all(warm_info.num_steps <= cold_info.num_steps)
+    assert jnp.median(warm_info.num_steps) <= 1
+
+
+def test_batch_freezing(distribution_name: str | None) -> None:
+    """Test that converged elements freeze while hard elements continue in the tail."""
+    DirichletInfo.skip_if_deselected(distribution_name)
+    alpha_minus_one = jnp.zeros((10, 3)).at[3].set(jnp.asarray([-0.95, -0.9, 30.0]))
+    exp_parameters = DirichletNP(alpha_minus_one).to_exp()
+    initial_search_parameters = exp_parameters.initial_search_parameters()
+    x, info = NewtonMinimizer().solve_batch(exp_parameters, initial_search_parameters)
+    tail_x, tail_info = NewtonMinimizer(batch_steps=2, tail_size=3).solve_batch(
+        exp_parameters, initial_search_parameters)
+    assert jnp.all(info.converged)
+    assert jnp.all(tail_info.converged)
+    assert jnp.max(jnp.delete(info.num_steps, 3)) < info.num_steps[3]
+    assert_tree_allclose(tail_x, x, atol=1e-6, rtol=1e-6)
+    assert_tree_allclose(tail_info.num_steps, info.num_steps)
+
+
+@pytest.mark.parametrize('info', [DirichletInfo(dimensions=3), GammaInfo(), LogarithmicInfo()],
+                         ids=lambda info: info.name())
+def test_to_nat_with_info(generator: Generator,
+                          distribution_name: str | None,
+                          info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test the diagnostics reported by to_nat_with_info."""
+    info.skip_if_deselected(distribution_name)
+    shape = (3, 4)
+    exp_parameters = info.exp_parameter_generator(generator, shape=shape)
+    nat_parameters, diagnostics = exp_parameters.to_nat_with_info()
+    assert_tree_allclose(nat_parameters, exp_parameters.to_nat())
+    assert diagnostics.converged.shape == shape
+    assert diagnostics.num_steps.shape == shape
+    assert diagnostics.residual_norm.shape == shape
+    assert jnp.all(diagnostics.converged)
+    assert jnp.all(diagnostics.num_steps > 0)
+    assert jnp.all(diagnostics.residual_norm < 1e-5)  # noqa: PLR2004
+
+
+def test_to_nat_with_info_failure(distribution_name: str | None) -> None:
+    """Test that running out of steps is reported."""
+    DirichletInfo.skip_if_deselected(distribution_name)
+    nat_parameters = DirichletNP(jnp.asarray([[-0.95, -0.9, 30.0], [0.0, 0.0, 0.0]]))
+    exp_parameters = replace(nat_parameters.to_exp(), minimizer=NewtonMinimizer(max_steps=2))
+    _, diagnostics = exp_parameters.to_nat_with_info()
+    assert not diagnostics.converged[0]
+    assert diagnostics.num_steps[0] == 2  # noqa: PLR2004
+    assert diagnostics.residual_norm[0] > 1e-5  # noqa: PLR2004
+
+
+@pytest.mark.parametrize('info', [BetaInfo(), DirichletInfo(dimensions=1000)],
+                         ids=lambda info: info.name())
+def test_dirichlet_minimizer(generator: Generator,
+                             distribution_name: str | None,
+                             info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the Dirichlet minimizer inverts parameters with many categories quickly."""
+    info.skip_if_deselected(distribution_name)
+    nat_parameters = info.nat_parameter_generator(generator, shape=(4,))
+    exp_parameters = nat_parameters.to_exp()
+    assert isinstance(exp_parameters.default_minimizer(info.dimensions), DirichletMinimizer)
+    final_nat_parameters, diagnostics = exp_parameters.to_nat_with_info()
+    assert_tree_allclose(final_nat_parameters.to_exp(), exp_parameters, atol=1e-6, rtol=1e-6)
+    assert jnp.all(diagnostics.converged)
+    assert jnp.max(diagnostics.num_steps) < 20  # noqa: PLR2004
+
+
+def test_dirichlet_minimizer_near_boundary(distribution_name: str | None) -> None:
+    """Test that the Dirichlet minimizer inverts parameters that are close to the boundary."""
+    DirichletInfo.skip_if_deselected(distribution_name)
+    nat_parameters = _near_boundary_parameters()['Dirichlet']
+    exp_parameters = nat_parameters.to_exp()
+    final_nat_parameters, diagnostics = exp_parameters.to_nat_with_info()
+    assert_tree_allclose(final_nat_parameters.to_exp(), exp_parameters, atol=1e-6, rtol=1e-6)
+    assert jnp.all(diagnostics.converged)
+
+
+def test_generalized_dirichlet_minimizer(generator: Generator,
+                                        distribution_name: str | None) -> None:
+    """Test that the decoupled minimizer inverts parameters, including tiny values of gamma."""
+    GeneralizedDirichletInfo.skip_if_deselected(distribution_name)
+    info = GeneralizedDirichletInfo(dimensions=5)
+    nat_parameters = info.nat_parameter_generator(generator, shape=(20,))
+    nat_parameters = replace(nat_parameters, gamma=nat_parameters.gamma.at[:5].multiply(1e-3))
+    exp_parameters = nat_parameters.to_exp()
+    assert isinstance(exp_parameters.default_minimizer(10), GeneralizedDirichletMinimizer)
+    final_nat_parameters, diagnostics = exp_parameters.to_nat_with_info()
+    assert_tree_allclose(final_nat_parameters.to_exp(), exp_parameters, atol=1e-6, rtol=1e-6)
+    assert jnp.all(diagnostics.converged)
+
+
+@pytest.mark.parametrize('dimensions', [2, 3, 50])
+def test_von_mises_fisher_minimizer(distribution_name: str | None, dimensions: int) -> None:
+    """Test that a few Newton steps invert the Bessel ratio across a wide range of kappa."""
+    VonMisesFisherInfo.skip_if_deselected(distribution_name)
+    kappa = jnp.asarray([1e-3, 0.1, 1.0, 5.0, 30.0, 300.0, 3000.0])
+    direction = jnp.ones(dimensions) / jnp.sqrt(dimensions)
+    nat_parameters = VonMisesFisherNP(kappa[:, jnp.newaxis] * direction)
+    exp_parameters = nat_parameters.to_exp()
+    assert isinstance(exp_parameters.default_minimizer(1), VonMisesFisherMinimizer)
+    final_nat_parameters, diagnostics = exp_parameters.to_nat_with_info()
+    assert_tree_allclose(final_nat_parameters, nat_parameters, rtol=1e-8)
+    assert jnp.all(diagnostics.converged)
+
+
+def test_construction_is_free(monkeypatch: pytest.MonkeyPatch,
+                              distribution_name: str | None) -> None:
+    """Test that constructing expectation parameters does not select a minimizer."""
+    DirichletInfo.skip_if_deselected(distribution_name)
+
+    def fail(self: DirichletEP) -> JaxRealArray:
+        raise AssertionError
+
+    monkeypatch.setattr(DirichletEP, 'initial_search_parameters', fail)
+    exp_parameters = DirichletEP(jnp.asarray([[-1.0, -2.0, -3.0]]))
+    flattener, flattened = Flattener.flatten(exp_parameters)
+    flattener.unflatten(flattened)
+    assert exp_parameters[0].minimizer is None
+
+
+def test_dirichlet_to_nat_gradient(distribution_name: str | None) -> None:
+    """Test that gradients pass through the Newton minimizer."""
+    DirichletInfo.skip_if_deselected(distribution_name)
+    nat_parameters = DirichletNP(jnp.asarray([[0.5, 1.0, 2.0], [3.0, -0.5, 0.2]]))
+    flattener, flattened = Flattener.flatten(nat_parameters.to_exp(), map_to_plane=False)
+
+    def f(flattened: JaxRealArray) -> JaxRealArray:
+        exp_parameters: DirichletEP = flattener.unflatten(flattened)
+        return jnp.sum(jnp.square(exp_parameters.to_nat().alpha_minus_one))
+
+    gradient = grad(f)(flattened)
+    assert jnp.all(jnp.isfinite(gradient))
+    check_grads(f, (flattened,), order=1, atol=1e-5, rtol=1e-4)
+
+
+def test_gamma_to_nat_gradient(distribution_name: str | None) -> None:
+    """Test that gradients pass through the default minimizer of a single search parameter."""
+    GammaInfo.skip_if_deselected(distribution_name)
+    nat_parameters = GammaNP(jnp.asarray([-1.0, -0.5, -3.0]), jnp.asarray([0.5, -0.3, 4.0]))
+    flattener, flattened = Flattener.flatten(nat_parameters.to_exp(), map_to_plane=False)
+
+    def f(flattened: JaxRealArray) -> JaxRealArray:
+        exp_parameters: GammaEP = flattener.unflatten(flattened)
+        nat_parameters = exp_parameters.to_nat()
+        return jnp.sum(jnp.square(nat_parameters.negative_rate)
+                       + jnp.square(nat_parameters.shape_minus_one))
+
+    check_grads(f, (flattened,), order=1, atol=1e-5, rtol=1e-4)
+
+
+def _solver_compilations(caplog: pytest.LogCaptureFixture) -> int:
+    return sum('Compiling _flat_to_nat_with_info' in record.getMessage()
+               for record in caplog.records)
+
+
+def test_batch_rank_shares_solver(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that batches with the same number of elements share one compiled solver."""
+    mean = jnp.linspace(0.5, 2.0, 23)
+    p = GammaEP(mean, jnp.log(mean) - 0.5)
+    with caplog.at_level(logging.WARNING), log_compiles():
+        q = p.to_nat()
+        assert _solver_compilations(caplog) == 1
+        p_reshaped = parameter_reshape(p, (23, 1))
+        q_reshaped = p_reshaped.to_nat()
+        assert _solver_compilations(caplog) == 1
+    assert q_reshaped.shape == (23, 1)
+    assert_tree_allclose(parameter_reshape(q_reshaped, (23,)), q)
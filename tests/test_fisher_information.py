@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Any
 
+import jax
 import jax.numpy as jnp
 import numpy as np
 from numpy.random import Generator
 from tjax import assert_tree_allclose
 
-from efax import MultivariateNormalNP
+from efax import (Flattener, GammaNP, JointDistributionN, MultinomialNP, MultivariateNormalNP,
+                  NaturalParametrization, NormalNP)
 
 from .create_info import MultivariateNormalInfo
 from .distribution_info import DistributionInfo
@@ -72,3 +74,73 @@ def test_fisher_information_is_convex(generator: Generator,
         msg = (f"The determinant of the Fisher information of {nat_parameters} is not all "
                f"nonnegative: {determinant}")
         raise AssertionError(msg)
+
+
+def test_fisher_information_matrix(generator: Generator,
+                                   distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the closed-form Fisher information matches automatic differentiation."""
+    nat_parameters = distribution_info.nat_parameter_generator(generator, shape=(3, 2))
+    assert_tree_allclose(nat_parameters.fisher_information_matrix(),
+                         nat_parameters._fisher_information_matrix(),  # noqa: SLF001
+                         rtol=1e-5, atol=1e-8)
+
+
+def test_log_jeffreys_prior(generator: Generator,
+                            distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the log-Jeffreys prior matches the log-determinant of the Fisher information."""
+    nat_parameters = distribution_info.nat_parameter_generator(generator, shape=(3, 2))
+    fisher_information = nat_parameters._fisher_information_matrix()  # noqa: SLF001
+    _, log_determinant = jnp.linalg.slogdet(fisher_information)
+    assert_tree_allclose(nat_parameters.log_jeffreys_prior(), 0.5 * log_determinant,
+                         rtol=1e-5, atol=1e-6)
+
+
+def test_multinomial_fisher_information_matrix() -> None:
+    """Test the closed-form Fisher information of the multinomial distribution."""
+    q = MultinomialNP(jnp.asarray([[0.5, -1.0, 2.0], [0.0, 0.0, 0.0]]))
+    assert_tree_allclose(q.fisher_information_matrix(),
+                         q._fisher_information_matrix(),  # noqa: SLF001
+                         rtol=1e-5, atol=1e-8)
+
+
+def test_fisher_information_diagonal(generator: Generator,
+                                     distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the diagonal of the Fisher information matches that of the matrix."""
+    nat_parameters = distribution_info.nat_parameter_generator(generator, shape=(3, 2))
+    fisher_information = nat_parameters._fisher_information_matrix()  # noqa: SLF001
+    assert_tree_allclose(nat_parameters.flat_fisher_information_diagonal(),
+                         jnp.diagonal(fisher_information, axis1=-2, axis2=-1),
+                         rtol=1e-5, atol=1e-8)
+
+
+def test_fisher_information_diagonal_estimate() -> None:
+    """Test Hutchinson's estimator when the Fisher information is diagonal."""
+    q = NormalNP(jnp.zeros(4), -jnp.linspace(0.5, 2.0, 4))
+    estimate = q.fisher_information_diagonal_estimate(jax.random.key(0), samples=3)
+    assert_tree_allclose(estimate, q.fisher_information_diagonal())
+    r = MultinomialNP(jnp.asarray([[0.5, -1.0, 2.0], [0.0, 0.0, 0.0]]))
+    multinomial_estimate = r.fisher_information_diagonal_estimate(jax.random.key(1),
+                                                                  samples=20000)
+    assert_tree_allclose(multinomial_estimate, r.fisher_information_diagonal(), atol=2e-2)
+
+
+def test_inverse_fisher_apply() -> None:
+    """Test the Fisher operator and its inverse on batched and joint distributions."""
+    normal = NormalNP(jnp.asarray([[0.5, -1.0], [2.0, 0.0]]),
+                      -jnp.asarray([[0.5, 1.0], [2.0, 0.7]]))
+    gamma = GammaNP(-jnp.asarray([[1.0, 2.0], [0.5, 3.0]]), jnp.asarray([[0.5, 1.0], [2.0, 0.0]]))
+    mvn = MultivariateNormalNP(jnp.asarray([[1.0, 2.0], [-1.0, 0.5]]),
+                               jnp.asarray([[[-1.0, 0.2], [0.2, -0.5]],
+                                            [[-2.0, -0.3], [-0.3, -0.8]]]))
+    joint = JointDistributionN({'gamma': gamma, 'normal': normal})
+    distributions: list[NaturalParametrization[Any, Any]] = [normal, gamma, mvn, joint]
+    for q in distributions:
+        flattener, flattened = Flattener.flatten(q, map_to_plane=False)
+        vector = jnp.sin(jnp.arange(flattened.size).reshape(flattened.shape) + 1.0)
+        fisher_information = q._fisher_information_matrix()  # noqa: SLF001
+        assert_tree_allclose(q.fisher_operator().mv(vector),
+                             jnp.einsum('...ij,...j->...i', fisher_information, vector))
+        expected = jnp.linalg.solve(fisher_information, vector[..., jnp.newaxis])[..., 0]
+        expectation_flattener, _ = Flattener.flatten(q.to_exp(), map_to_plane=False)
+        solution = q.inverse_fisher_apply(expectation_flattener.unflatten(vector))
+        assert_tree_allclose(solution, flattener.unflatten(expected), rtol=1e-5, atol=1e-6)
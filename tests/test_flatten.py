@@ -5,11 +5,15 @@ from typing import Any
 import jax.numpy as jnp
 import numpy as np
 import pytest
+from jax import tree
 from numpy.random import Generator
 from tjax import assert_tree_allclose
 
-from efax import Flattener, MultivariateUnitNormalNP
+from efax import (Flattener, MultivariateUnitNormalNP, NormalNP, Structure, SymmetricMatrixSupport,
+                  pack_symmetric_matrix, parameter_dot_product, parameters, support,
+                  unpack_symmetric_matrix)
 
+from .create_info import MultivariatePackedNormalInfo
 from .distribution_info import DistributionInfo
 
 
@@ -38,3 +42,80 @@ def test_raises() -> None:
         flattener.unflatten(jnp.zeros(5))
     with pytest.raises(ValueError, match="Incompatible array"):
         flattener.unflatten(jnp.zeros(12))
+
+
+def test_layout(generator: Generator, distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the flattened layout is static, cached, and consistent with flattening."""
+    p = distribution_info.nat_parameter_generator(generator, shape=(3,))
+    flattener, flattened = Flattener.flatten(p)
+    layout = flattener.layout()
+    assert layout is Flattener.flatten(p)[0].layout()
+    assert layout.size == flattened.shape[-1]
+    field_layouts = [field_layout
+                     for info_field_layouts in layout.fields
+                     for field_layout in info_field_layouts]
+    starts = [field_layout.start for field_layout in field_layouts]
+    stops = [field_layout.stop for field_layout in field_layouts]
+    assert starts == [0, *stops[:-1]]
+
+
+def test_parameter_metadata() -> None:
+    """Test the parameter metadata that is cached per class."""
+    q = NormalNP(jnp.zeros(3), -jnp.ones(3))
+    assert support(q) == support(NormalNP)
+    assert list(parameters(q)) == [('mean_times_precision',), ('negative_half_precision',)]
+    assert list(parameters(q, fixed=True)) == []
+
+
+def test_structure_is_interned() -> None:
+    """Test that structures with the same layout share their static information."""
+    p = NormalNP(jnp.zeros(3), -jnp.ones(3))
+    q = NormalNP(jnp.ones(5), -2.0 * jnp.ones(5))
+    assert Structure.create(p).infos is Structure.create(q).infos
+    p_flattener, _ = Flattener.flatten(p)
+    q_flattener, _ = Flattener.flatten(q)
+    assert hash(tree.structure(p_flattener)) == hash(tree.structure(q_flattener))
+    assert tree.structure(p_flattener) == tree.structure(q_flattener)
+
+
+@pytest.mark.parametrize('hermitian', [False, True])
+def test_packed_symmetric_matrix(generator: Generator, *, hermitian: bool) -> None:
+    """Test that packing and unpacking symmetric matrices round-trips."""
+    support_ = SymmetricMatrixSupport(hermitian=hermitian)
+    x = support_.generate(generator, (3,), 4)
+    packed = pack_symmetric_matrix(x)
+    assert packed.shape == (3, 10)
+    assert_tree_allclose(unpack_symmetric_matrix(packed, hermitian=hermitian), x)
+    flattened = support_.flattened(x, map_to_plane=False)
+    assert_tree_allclose(support_.unflattened(flattened, 4, map_from_plane=False), x)
+
+
+def test_packed_symmetric_matrix_support(generator: Generator) -> None:
+    """Test that the packed support flattens like the full support and preserves dot products."""
+    full = SymmetricMatrixSupport()
+    packed = SymmetricMatrixSupport(packed=True)
+    x = full.generate(generator, (3,), 4)
+    y = full.generate(generator, (3,), 4)
+    packed_x = pack_symmetric_matrix(x)
+    packed_y = pack_symmetric_matrix(y)
+    assert packed.shape(4) == (10,)
+    assert packed.num_elements(4) == full.num_elements(4)
+    assert_tree_allclose(packed.flattened(packed_x, map_to_plane=False),
+                         full.flattened(x, map_to_plane=False))
+    assert_tree_allclose(packed.unflattened(packed_x, 4, map_from_plane=False), packed_x)
+    assert_tree_allclose(jnp.sum(packed_x * packed.packed_weights(4) * packed_y, axis=-1),
+                         jnp.sum(x * y, axis=(-2, -1)))
+
+
+def test_packed_distribution(generator: Generator) -> None:
+    """Test that a packed family round-trips and has the dot products of the full family."""
+    q = MultivariatePackedNormalInfo(dimensions=4).nat_parameter_generator(generator, (3,))
+    p = q.to_exp()
+    assert q.negative_half_precision.shape == (3, 10)
+    flattener, flattened = Flattener.flatten(q, map_to_plane=False)
+    assert_tree_allclose(flattener.unflatten(flattened), q)
+    full_flattener, full_flattened = Flattener.flatten(q.unpacked(), map_to_plane=False)
+    assert_tree_allclose(flattened, full_flattened)
+    assert_tree_allclose(full_flattener.unflatten(flattened), q.unpacked())
+    assert_tree_allclose(parameter_dot_product(q, p),
+                         parameter_dot_product(q.unpacked(), p.unpacked()))
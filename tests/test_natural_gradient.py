@@ -0,0 +1,70 @@
+"""These tests apply to the natural-gradient transformation."""
+from __future__ import annotations
+
+from typing import Any, cast
+
+import jax.numpy as jnp
+import optax
+import pytest
+from jax import grad
+from tjax import JaxRealArray, assert_tree_allclose
+
+from efax import (BernoulliEP, BernoulliNP, ExpectationParametrization, Flattener, GammaNP,
+                  NaturalParametrization, NormalNP, natural_gradient, parameter_dot_product)
+
+
+def _negative_likelihood(q: NaturalParametrization[Any, Any], target: JaxRealArray
+                         ) -> JaxRealArray:
+    # The cross-entropy without the carrier measure.
+    flattener, _ = Flattener.flatten(q, map_to_plane=False)
+    target_parameters = flattener.unflatten(target)
+    return jnp.sum(q.log_normalizer() - parameter_dot_product(target_parameters, q))
+
+
+@pytest.mark.nondistribution
+def test_mirror_step() -> None:
+    """Test that the natural gradient is the gradient with respect to the expectation parameters."""
+    normal = NormalNP(jnp.asarray([0.5, -1.0]), -jnp.asarray([0.5, 1.0]))
+    gamma = GammaNP(-jnp.asarray([1.0, 2.0]), jnp.asarray([0.5, 1.0]))
+    distributions: list[NormalNP | GammaNP] = [normal, gamma]
+    for q in distributions:
+        _, flattened = Flattener.flatten(q.to_exp(), map_to_plane=False)
+        target = flattened + jnp.asarray([[0.1, 0.3], [-0.2, 0.4]])
+        q_bar = grad(_negative_likelihood)(q, target)
+        updates, _ = natural_gradient().update(q_bar, optax.EmptyState(), cast('optax.Params', q))
+        ep_cls = type(q.to_exp())
+
+        def loss(p: JaxRealArray, q: NormalNP | GammaNP = q,
+                 ep_cls: type[ExpectationParametrization[Any]] = ep_cls,
+                 target: JaxRealArray = target) -> JaxRealArray:
+            flattener = Flattener.create_flattener(q, ep_cls, mapped_to_plane=False)
+            return _negative_likelihood(flattener.unflatten(p).to_nat(), target)
+
+        _, expected = Flattener.flatten(cast('NaturalParametrization[Any, Any]', updates),
+                                        map_to_plane=False)
+        assert_tree_allclose(expected, grad(loss)(flattened), rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.nondistribution
+def test_natural_gradient_descent() -> None:
+    """Test that natural-gradient descent converges much faster than gradient descent."""
+    target = BernoulliEP(jnp.asarray([0.05, 0.4, 0.95]))
+
+    def loss(q: BernoulliNP) -> JaxRealArray:
+        return jnp.sum(target.cross_entropy(q))
+
+    optimizer = optax.chain(natural_gradient(), optax.sgd(1.0))
+    q = BernoulliNP(jnp.zeros(3))
+    state = optimizer.init(cast('optax.Params', q))
+    for _ in range(10):
+        updates, state = optimizer.update(grad(loss)(q), state, cast('optax.Params', q))
+        q = cast('BernoulliNP', optax.apply_updates(cast('optax.Params', q), updates))
+    assert_tree_allclose(q, target.to_nat(), atol=1e-6)
+
+
+@pytest.mark.nondistribution
+def test_natural_gradient_requires_params() -> None:
+    """Test that the transformation cannot be updated without the parameters."""
+    q = BernoulliNP(jnp.zeros(3))
+    with pytest.raises(ValueError, match='params'):
+        natural_gradient().update(cast('optax.Updates', q), optax.EmptyState())
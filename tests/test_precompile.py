@@ -0,0 +1,64 @@
+"""These tests are related to exporting and loading precompiled kernels."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax._src.compilation_cache import reset_cache  # noqa: PLC2701
+from tjax import assert_tree_allclose
+
+from efax import DirichletNP, NormalNP, PoissonNP, load_precompiled, precompile
+
+
+def test_precompile(tmp_path: Path) -> None:
+    """Test that exported kernels match the methods that they were exported from."""
+    precompile([NormalNP, DirichletNP, PoissonNP], [(3,)], [jnp.float64], tmp_path,
+               dimensions=4, compile_cache=False)
+    kernels = load_precompiled(tmp_path)
+    assert (NormalNP, 'log_pdf', (3,), 'float64', 1) in kernels
+    assert (DirichletNP, 'to_exp', (3,), 'float64', 4) in kernels
+
+    q = NormalNP(jnp.asarray([0.0, 1.0, 2.0]), -jnp.asarray([0.5, 1.0, 2.0]))
+    x = jnp.asarray([0.5, -1.0, 3.0])
+    assert_tree_allclose(kernels('log_normalizer', q), q.log_normalizer())
+    assert_tree_allclose(kernels('log_pdf', q, x), q.log_pdf(x))
+    p = kernels('to_exp', q)
+    assert_tree_allclose(p, q.to_exp())
+    assert_tree_allclose(kernels('to_nat', p), q, rtol=1e-5)
+
+    r = DirichletNP(jnp.ones((3, 4)))
+    assert_tree_allclose(kernels('to_exp', r), r.to_exp())
+    s = PoissonNP(jnp.asarray([0.0, 1.0, -1.0]))
+    y = jnp.asarray([0, 2, 1])
+    assert_tree_allclose(kernels('log_pdf', s, y), s.log_pdf(y))
+    # Shapes that were not exported fall back to the method.
+    assert_tree_allclose(kernels('log_normalizer', q[:2]), q[:2].log_normalizer())
+
+
+@pytest.fixture
+def _restore_compilation_cache() -> Generator[None]:
+    options = ('jax_compilation_cache_dir', 'jax_persistent_cache_min_compile_time_secs',
+               'jax_persistent_cache_min_entry_size_bytes')
+    original = {option: jax.config.values[option] for option in options}
+    yield
+    reset_cache()
+    for option, value in original.items():
+        jax.config.update(option, value)
+
+
+@pytest.mark.usefixtures('_restore_compilation_cache')
+def test_precompile_compilation_cache(tmp_path: Path) -> None:
+    """Test that the kernels are compiled into the persistent cache of each directory."""
+    q = NormalNP(jnp.asarray([0.0, 1.0]), -jnp.asarray([0.5, 1.0]))
+    for directory in ('first', 'second'):
+        path = tmp_path / directory
+        precompile([NormalNP], [(2,)], [jnp.float64], path, methods=['log_normalizer'])
+        # The cache is reconfigured even though the process has already used a cache.
+        cache_path = path / 'compilation_cache'
+        assert any(cache_path.iterdir())
+        kernels = load_precompiled(path)
+        assert jax.config.values['jax_compilation_cache_dir'] == str(cache_path)
+        assert_tree_allclose(kernels('log_normalizer', q), q.log_normalizer())
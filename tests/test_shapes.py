@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
+import jax.numpy as jnp
 import numpy as np
+from jax import tree
 from numpy.random import Generator
 
-from efax import HasEntropyEP, HasEntropyNP, SimpleDistribution, parameters
+from efax import (HasEntropyEP, HasEntropyNP, SimpleDistribution, SymmetricMatrixSupport,
+                  parameter_broadcast_to, parameter_concatenate, parameter_dot_product,
+                  parameter_map, parameter_reshape, parameter_set, parameter_stack, parameter_take,
+                  parameter_where, parameters)
 
 from .distribution_info import DistributionInfo
 
@@ -45,3 +50,75 @@ def test_types(distribution_info: DistributionInfo[Any, Any, Any]) -> None:
     if isinstance(distribution_info.exp_parameter_generator(np.random.default_rng(), ()), tuple):
         msg = "This should return a number or an ndarray"
         raise TypeError(msg)
+
+
+def test_indexing(generator: Generator,
+                  distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that indexing, taking, selecting, and setting act on every parameter."""
+    shape = (5, 4)
+    p = distribution_info.nat_parameter_generator(generator, shape=shape)
+    q = distribution_info.nat_parameter_generator(generator, shape=shape)
+    indices = jnp.asarray([3, 0, 3])
+    mask = jnp.asarray([True, False, True, False, False])[:, jnp.newaxis]
+
+    def leaves_equal(x: Any, y: Any) -> None:
+        for x_leaf, y_leaf in zip(tree.leaves(x), tree.leaves(y), strict=True):
+            np.testing.assert_array_equal(x_leaf, y_leaf)
+
+    assert p[1].shape == (4,)
+    assert parameter_take(p, indices).shape == (3, 4)
+    assert parameter_take(p, indices, axis=-1).shape == (5, 3)
+    leaves_equal(parameter_take(p, indices)[0], p[3])
+    selected = parameter_where(mask, p, q)
+    leaves_equal(selected[0], p[0])
+    leaves_equal(selected[1], q[1])
+    replaced = parameter_set(p, jnp.asarray([1, 2]), q[:2])
+    leaves_equal(replaced[1:3], q[:2])
+    leaves_equal(replaced[0], p[0])
+
+
+def test_batch_shape_operations(generator: Generator,
+                                distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that stacking, concatenating, reshaping, and broadcasting act on every parameter."""
+    p = distribution_info.nat_parameter_generator(generator, shape=(2, 3))
+    q = distribution_info.nat_parameter_generator(generator, shape=(2, 3))
+
+    def leaves_equal(x: Any, y: Any) -> None:
+        for x_leaf, y_leaf in zip(tree.leaves(x), tree.leaves(y), strict=True):
+            np.testing.assert_array_equal(x_leaf, y_leaf)
+
+    stacked = parameter_stack([p, q], axis=-1)
+    assert stacked.shape == (2, 3, 2)
+    leaves_equal(stacked[:, :, 1], q)
+    concatenated = parameter_concatenate([p, q], axis=1)
+    assert concatenated.shape == (2, 6)
+    leaves_equal(concatenated[:, 3:], q)
+    reshaped = parameter_reshape(p, (3, -1))
+    assert reshaped.shape == (3, 2)
+    leaves_equal(parameter_reshape(reshaped, (2, 3)), p)
+    broadcast = parameter_broadcast_to(p[0], (4, 3))
+    assert broadcast.shape == (4, 3)
+    leaves_equal(broadcast[2], p[0])
+
+
+def test_parameter_dot_product(generator: Generator,
+                               distribution_info: DistributionInfo[Any, Any, Any]) -> None:
+    """Test that the fused dot product matches the sum of the per-field dot products."""
+    shape = (3, 2)
+    q = distribution_info.nat_parameter_generator(generator, shape=shape)
+    p = distribution_info.exp_parameter_generator(generator, shape=shape)
+    expected = sum(jnp.sum(x * y * (support.packed_weights(distribution_info.dimensions)
+                                    if isinstance(support, SymmetricMatrixSupport)
+                                    and support.packed
+                                    else 1.0),
+                           axis=tuple(range(-support.axes(), 0))).real
+                   for (x, support), y in zip(parameters(q, fixed=False, support=True).values(),
+                                              parameters(p, fixed=False).values(),
+                                              strict=True))
+    np.testing.assert_allclose(parameter_dot_product(q, p), expected, rtol=1e-6)
+    difference = parameter_map(jnp.subtract, q, q)
+    for value in parameters(difference, fixed=False).values():
+        np.testing.assert_array_equal(value, jnp.zeros_like(value))
+    for value, expected_value in zip(parameters(difference, fixed=True).values(),
+                                     parameters(q, fixed=True).values(), strict=True):
+        np.testing.assert_array_equal(value, expected_value)
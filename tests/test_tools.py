@@ -0,0 +1,23 @@
+"""These tests are related to the numerical tools."""
+from __future__ import annotations
+
+import jax.numpy as jnp
+from jax.scipy import special as jss
+from jax.test_util import check_grads
+from numpy.testing import assert_allclose
+
+from efax import inverse_digamma
+
+
+def test_inverse_digamma() -> None:
+    """Test that inverse_digamma inverts digamma on the positive reals."""
+    x = jnp.logspace(-3.0, 3.0, 200)
+    assert_allclose(inverse_digamma(jss.digamma(x)), x, rtol=1e-10)
+    y = jnp.linspace(-30.0, 6.0, 200)
+    assert_allclose(jss.digamma(inverse_digamma(y)), y, rtol=1e-10, atol=1e-10)
+
+
+def test_inverse_digamma_gradient() -> None:
+    """Test the custom derivative of inverse_digamma."""
+    y = jnp.linspace(-10.0, 5.0, 20)
+    check_grads(inverse_digamma, (y,), order=2, atol=1e-6, rtol=1e-6)